@@ -1,18 +1,89 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+import numpy as np
 from datetime import datetime
+from types import MappingProxyType
 import io
-import base64
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-import tempfile
-import os
+
+# Plotly is only needed once the charts are drawn, so defer its import until then
+def _load_plotly():
+    global go, make_subplots, plotly_colors
+    if 'go' not in globals():
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        import plotly.colors as plotly_colors
+
+# ReportLab is only needed for the PDF report, so defer its import until then as well
+def _load_reportlab():
+    global A4, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    global getSampleStyleSheet, ParagraphStyle, inch, colors, TA_CENTER
+    if 'SimpleDocTemplate' not in globals():
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+
+# The footer only changes with the date, so build it once per process and refresh it hourly
+@st.cache_resource(ttl=3600)
+def _footer_html():
+    return f"""
+<div style='text-align: center; color: #6b7280; padding: 1rem;'>
+    <p>🚁 AeroRent UK Financial Calculator | Built with Streamlit</p>
+    <p>Last updated: {datetime.now():%B %d, %Y}</p>
+</div>
+"""
+
+# SD cards are bought one per drone at a fixed unit price
+SD_CARD_UNIT_COST = 38.99
+
+# Input parameter rows for the export: (category, parameter, inputs key, unit)
+_INPUT_ROWS = (
+    ('Capital Expenditure', 'DJI Flips Quantity', 'flip_qty', 'units'),
+    ('Capital Expenditure', 'DJI Flip Cost per Unit', 'flip_cost', '£'),
+    ('Capital Expenditure', 'DJI Mini 4 Pros Quantity', 'mini4_qty', 'units'),
+    ('Capital Expenditure', 'DJI Mini 4 Pro Cost per Unit', 'mini4_cost', '£'),
+    ('Capital Expenditure', 'Hard Case Cost per Unit', 'case_cost_per_unit', '£'),
+    ('Capital Expenditure', 'Extra Batteries Cost', 'battery_cost', '£'),
+    ('Capital Expenditure', 'ND Filters Cost', 'filter_cost', '£'),
+    ('Capital Expenditure', 'Website Setup Cost', 'web_cost', '£'),
+    ('Capital Expenditure', 'SD Cards Cost', 'sd_card_total', '£'),
+    ('Capital Expenditure', 'Legal Fees', 'legal_cost', '£'),
+    ('Operational Costs', 'E-commerce Platform', 'platform_cost', '£'),
+    ('Operational Costs', 'Domain & Hosting', 'domain_cost', '£'),
+    ('Operational Costs', 'Corporate Insurance', 'insurance_cost', '£'),
+    ('Operational Costs', 'CAA Renewal', 'caa_cost', '£'),
+    ('Operational Costs', 'Digital Marketing', 'marketing_cost', '£'),
+    ('Operational Costs', 'Repairs & Maintenance', 'repairs_cost', '£'),
+    ('Operational Costs', 'Accountant Costs (Monthly)', 'accountant_cost', '£'),
+    ('Operational Costs', 'Shipping Supplies', 'shipping_cost', '£'),
+    ('Operational Costs', 'Shipping Cost per Rental', 'shipping_per_rental', '£'),
+    ('Pricing Strategy', 'DJI Flip Daily Price', 'flip_daily', '£'),
+    ('Pricing Strategy', 'DJI Flip Weekend Price', 'flip_weekend', '£'),
+    ('Pricing Strategy', 'DJI Flip Weekly Price', 'flip_weekly', '£'),
+    ('Pricing Strategy', 'DJI Mini 4 Pro Daily Price', 'mini4_daily', '£'),
+    ('Pricing Strategy', 'DJI Mini 4 Pro Weekend Price', 'mini4_weekend', '£'),
+    ('Pricing Strategy', 'DJI Mini 4 Pro Weekly Price', 'mini4_weekly', '£'),
+    ('Pricing Strategy', 'Rental Mix Daily %', 'mix_daily', '%'),
+    ('Pricing Strategy', 'Rental Mix Weekend %', 'mix_weekend', '%'),
+    ('Pricing Strategy', 'Rental Mix Weekly %', 'mix_weekly', '%'),
+    ('Pricing Strategy', 'Payment Processing Fee %', 'processing_fee', '%'),
+)
+
+# Key metric rows for the export: (metric, results key, unit)
+_METRIC_ROWS = (
+    ('Total First-Year Costs', 'total_first_year_costs', '£'),
+    ('Weighted Average Revenue per Day', 'weighted_avg_revenue', '£'),
+    ('Contribution Margin per Day', 'contribution_margin', '£'),
+    ('Break-Even Days', 'break_even_days', 'days'),
+    ('Break-Even Utilisation Rate', 'break_even_utilisation', '%'),
+    ('Total Drones', 'total_drones', 'units'),
+    ('Total Available Days', 'total_available_days', 'days'),
+    ('Variable Cost per Rental', 'variable_cost_per_rental', '£'),
+    ('Annual Operational Costs', 'opex', '£'),
+    ('Capital Expenditure', 'capex', '£'),
+)
 
 # Define presets
 PRESETS = {
@@ -87,6 +158,23 @@ PRESETS = {
         "mix_weekly": 25.0
     }
 }
+# Presets are shared defaults, so expose them read-only
+PRESETS = MappingProxyType({name: MappingProxyType(values) for name, values in PRESETS.items()})
+
+# Static VAT planning guidance shown in the VAT Analysis tab
+_VAT_INSIGHTS = """
+<div style="background-color: #f8fafc; padding: 1rem; border-radius: 0.5rem; border-left: 4px solid #4f46e5;">
+    <h4>💡 VAT Planning Insights:</h4>
+    <ul>
+        <li><strong>VAT Registration Decision:</strong> If your annual revenue exceeds £85,000, you must register for VAT. This is a one-time decision.</li>
+        <li><strong>VAT-Deductible Costs:</strong> Ensure all business expenses are VAT-deductible to reduce your net VAT payable.</li>
+        <li><strong>VAT on Revenue:</strong> Always charge VAT on VATable revenue (e.g., drone rentals, website hosting).</li>
+        <li><strong>Quarterly VAT Payments:</strong> If you register for VAT, you must pay VAT quarterly to HMRC.</li>
+        <li><strong>VAT Refunds:</strong> If you register for VAT, you can claim back VAT on purchases and certain operational costs.</li>
+        <li><strong>VAT Recovery:</strong> Your current VAT recovery rate shows how much VAT you can claim back on business expenses.</li>
+    </ul>
+</div>
+"""
 
 # Page configuration
 st.set_page_config(
@@ -97,7 +185,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -112,23 +200,6 @@ st.markdown("""
         text-align: center;
         margin-bottom: 2rem;
     }
-    .metric-card {
-        background-color: white;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-        border-left: 4px solid #4f46e5;
-    }
-    .break-even-highlight {
-        background-color: #eef2ff;
-        border-left: 4px solid #4f46e5;
-    }
-    .profit-positive {
-        color: #059669;
-    }
-    .profit-negative {
-        color: #dc2626;
-    }
     .download-section {
         background-color: #f8fafc;
         padding: 1rem;
@@ -145,12 +216,68 @@ st.markdown("""
         margin-bottom: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Main header
 st.markdown('<h1 class="main-header">🚁 AeroRent UK - Financial Calculator</h1>', unsafe_allow_html=True)
 st.markdown('<p class="sub-header">Interactive financial projections for your drone rental business</p>', unsafe_allow_html=True)
 
+# Remove an additional cost before the rerun triggered by its delete button
+def remove_additional_cost(index):
+    st.session_state.additional_costs.pop(index)
+    # Widget state is keyed by position, so clear it from the removed row onwards
+    # and let the remaining rows re-render from their stored values
+    for i in range(index, len(st.session_state.additional_costs) + 1):
+        st.session_state.pop(f"cost_amount_{i}", None)
+        st.session_state.pop(f"cost_note_{i}", None)
+
+# Additional costs editor, rerun on its own so editing it doesn't recompute the whole calculator
+@st.fragment
+def render_additional_costs():
+    # Add new cost button
+    if st.button("➕ Add Additional Cost"):
+        st.session_state.additional_costs.append({"amount": 0.0, "note": ""})
+    
+    # Display existing additional costs
+    additional_costs_total = 0.0
+    
+    for i, cost in enumerate(st.session_state.additional_costs):
+        col1, col2, col3 = st.columns([1, 2, 0.5])
+        with col1:
+            new_amount = st.number_input(f"Amount (£)", min_value=0.0, value=cost["amount"], step=10.0, key=f"cost_amount_{i}")
+            st.session_state.additional_costs[i]["amount"] = new_amount
+        with col2:
+            new_note = st.text_input(f"Description", value=cost["note"], key=f"cost_note_{i}")
+            st.session_state.additional_costs[i]["note"] = new_note
+        with col3:
+            st.button("🗑️", key=f"remove_cost_{i}", on_click=remove_additional_cost, args=(i,))
+        
+        additional_costs_total += new_amount
+    
+    st.session_state.additional_costs_total = additional_costs_total
+    
+    # Display total additional costs
+    if additional_costs_total > 0:
+        st.markdown(f"**Total Additional Costs: £{additional_costs_total:,.2f}**")
+    
+    # Display additional costs breakdown as one markdown element rather than one per cost
+    if st.session_state.additional_costs:
+        breakdown_lines = ["**Additional Costs Breakdown:**", ""]
+        breakdown_lines.extend(
+            f"- £{cost['amount']:,.2f}: {cost['note'] if cost['note'] else 'No description'}"
+            for cost in st.session_state.additional_costs if cost["amount"] > 0
+        )
+        st.markdown("\n".join(breakdown_lines))
+    
+    # Only costs with an amount feed the calculations, so rerun the full app just when those change
+    signature = [(cost["amount"], cost["note"]) for cost in st.session_state.additional_costs if cost["amount"] > 0]
+    previous_signature = st.session_state.get('additional_costs_signature', signature)
+    st.session_state.additional_costs_signature = signature
+    if signature != previous_signature:
+        st.rerun()
+
 # Sidebar for inputs
 with st.sidebar:
     st.header("📊 Business Configuration")
@@ -177,66 +304,69 @@ with st.sidebar:
     # Get selected preset values
     preset_values = PRESETS[selected_preset]
     
-    # Capital Expenditure
-    st.subheader("1. Initial Capital Expenditure")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        flip_qty = st.number_input("DJI Flips (Qty)", min_value=0.0, value=preset_values["flip_qty"], step=1.0)
-        mini4_qty = st.number_input("DJI Mini 4 Pros (Qty)", min_value=0.0, value=preset_values["mini4_qty"], step=1.0)
-        case_cost_per_unit = st.number_input("Hard Case Cost per Unit (£)", min_value=0.0, value=preset_values["case_cost_per_unit"], step=10.0)
-        battery_cost = st.number_input("Extra Batteries Cost (£)", min_value=0.0, value=preset_values["battery_cost"], step=10.0)
-        filter_cost = st.number_input("ND Filters Cost (£)", min_value=0.0, value=preset_values["filter_cost"], step=10.0)
-    
-    with col2:
-        flip_cost = st.number_input("DJI Flip Cost (£)", min_value=0.0, value=preset_values["flip_cost"], step=10.0)
-        mini4_cost = st.number_input("DJI Mini 4 Pro Cost (£)", min_value=0.0, value=preset_values["mini4_cost"], step=10.0)
-        web_cost = st.number_input("Website Setup Cost (£)", min_value=0.0, value=preset_values["web_cost"], step=100.0)
-        legal_cost = st.number_input("Legal Fees (£)", min_value=0.0, value=preset_values["legal_cost"], step=50.0)
-    
-    # SD Cards (1 per drone)
-    total_drones_for_sd = flip_qty + mini4_qty
-    sd_card_cost_per_unit = 38.99
-    total_sd_card_cost = total_drones_for_sd * sd_card_cost_per_unit
-    
-    if total_drones_for_sd > 0:
-        st.markdown(f"**SD Cards**: {total_drones_for_sd} × £{sd_card_cost_per_unit} = £{total_sd_card_cost:.2f}**")
-    
-    # Hard Cases (1 per drone)
-    total_hard_cases_cost = total_drones_for_sd * case_cost_per_unit
-    
-    if total_drones_for_sd > 0 and case_cost_per_unit > 0:
-        st.markdown(f"**Hard Cases**: {total_drones_for_sd} × £{case_cost_per_unit} = £{total_hard_cases_cost:.2f}**")
-    
-    # Operational Expenditure
-    st.subheader("2. Annual Operational Costs")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        platform_cost = st.number_input("E-commerce Platform (£)", min_value=0.0, value=preset_values["platform_cost"], step=10.0)
-        insurance_cost = st.number_input("Corporate Insurance (£)", min_value=0.0, value=preset_values["insurance_cost"], step=50.0)
-        marketing_cost = st.number_input("Digital Marketing (£)", min_value=0.0, value=preset_values["marketing_cost"], step=500.0)
-    
-    with col2:
-        domain_cost = st.number_input("Domain & Hosting (£)", min_value=0.0, value=preset_values["domain_cost"], step=5.0)
-        caa_cost = st.number_input("CAA Renewal (£)", min_value=0.0, value=preset_values["caa_cost"], step=1.0)
-        repairs_cost = st.number_input("Repairs & Maintenance (£)", min_value=0.0, value=preset_values["repairs_cost"], step=10.0)
-    
-    # Accountant costs (monthly)
-    accountant_cost = st.number_input("Accountant Costs (Monthly £)", min_value=0.0, value=preset_values["accountant_cost"], step=25.0, help="Monthly accounting fees for bookkeeping, VAT returns, and tax compliance")
-    
-    # Shipping costs per rental
-    st.markdown("**Shipping Costs per Rental:**")
-    shipping_col1, shipping_col2 = st.columns(2)
-    with shipping_col1:
-        shipping_cost = st.number_input("Postage Cost per Rental (£)", min_value=0.0, value=preset_values["shipping_cost"], step=1.0)
-    with shipping_col2:
-        box_cost = st.number_input("Cardboard Box per Order (£)", min_value=0.0, value=preset_values["box_cost"], step=0.1)
-    
-    total_shipping_cost_per_rental = shipping_cost + box_cost
-    st.markdown(f"**Total Shipping Cost per Rental: £{total_shipping_cost_per_rental:.2f}** (Postage: £{shipping_cost:.2f} + Box: £{box_cost:.2f})")
-    
-    processing_fee = st.number_input("Payment Processing Fee (%)", min_value=0.0, value=preset_values["processing_fee"], step=0.1)
+    # Cost inputs are batched in a form, so editing several of them triggers one rerun on Apply
+    with st.form("business_config", border=False):
+        # Capital Expenditure
+        st.subheader("1. Initial Capital Expenditure")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            flip_qty = st.number_input("DJI Flips (Qty)", min_value=0.0, value=preset_values["flip_qty"], step=1.0)
+            mini4_qty = st.number_input("DJI Mini 4 Pros (Qty)", min_value=0.0, value=preset_values["mini4_qty"], step=1.0)
+            case_cost_per_unit = st.number_input("Hard Case Cost per Unit (£)", min_value=0.0, value=preset_values["case_cost_per_unit"], step=10.0)
+            battery_cost = st.number_input("Extra Batteries Cost (£)", min_value=0.0, value=preset_values["battery_cost"], step=10.0)
+            filter_cost = st.number_input("ND Filters Cost (£)", min_value=0.0, value=preset_values["filter_cost"], step=10.0)
+        
+        with col2:
+            flip_cost = st.number_input("DJI Flip Cost (£)", min_value=0.0, value=preset_values["flip_cost"], step=10.0)
+            mini4_cost = st.number_input("DJI Mini 4 Pro Cost (£)", min_value=0.0, value=preset_values["mini4_cost"], step=10.0)
+            web_cost = st.number_input("Website Setup Cost (£)", min_value=0.0, value=preset_values["web_cost"], step=100.0)
+            legal_cost = st.number_input("Legal Fees (£)", min_value=0.0, value=preset_values["legal_cost"], step=50.0)
+        
+        # SD Cards and Hard Cases (1 per drone), shown together in a single markdown element
+        total_drones_for_sd = flip_qty + mini4_qty
+        total_sd_card_cost = total_drones_for_sd * SD_CARD_UNIT_COST
+        total_hard_cases_cost = total_drones_for_sd * case_cost_per_unit
+        
+        per_drone_lines = []
+        if total_drones_for_sd > 0:
+            per_drone_lines.append(f"**SD Cards**: {total_drones_for_sd} × £{SD_CARD_UNIT_COST} = £{total_sd_card_cost:.2f}**")
+        if total_drones_for_sd > 0 and case_cost_per_unit > 0:
+            per_drone_lines.append(f"**Hard Cases**: {total_drones_for_sd} × £{case_cost_per_unit} = £{total_hard_cases_cost:.2f}**")
+        if per_drone_lines:
+            st.markdown("\n\n".join(per_drone_lines))
+        
+        # Operational Expenditure
+        st.subheader("2. Annual Operational Costs")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            platform_cost = st.number_input("E-commerce Platform (£)", min_value=0.0, value=preset_values["platform_cost"], step=10.0)
+            insurance_cost = st.number_input("Corporate Insurance (£)", min_value=0.0, value=preset_values["insurance_cost"], step=50.0)
+            marketing_cost = st.number_input("Digital Marketing (£)", min_value=0.0, value=preset_values["marketing_cost"], step=500.0)
+        
+        with col2:
+            domain_cost = st.number_input("Domain & Hosting (£)", min_value=0.0, value=preset_values["domain_cost"], step=5.0)
+            caa_cost = st.number_input("CAA Renewal (£)", min_value=0.0, value=preset_values["caa_cost"], step=1.0)
+            repairs_cost = st.number_input("Repairs & Maintenance (£)", min_value=0.0, value=preset_values["repairs_cost"], step=10.0)
+        
+        # Accountant costs (monthly)
+        accountant_cost = st.number_input("Accountant Costs (Monthly £)", min_value=0.0, value=preset_values["accountant_cost"], step=25.0, help="Monthly accounting fees for bookkeeping, VAT returns, and tax compliance")
+        
+        # Shipping costs per rental
+        st.markdown("**Shipping Costs per Rental:**")
+        shipping_col1, shipping_col2 = st.columns(2)
+        with shipping_col1:
+            shipping_cost = st.number_input("Postage Cost per Rental (£)", min_value=0.0, value=preset_values["shipping_cost"], step=1.0)
+        with shipping_col2:
+            box_cost = st.number_input("Cardboard Box per Order (£)", min_value=0.0, value=preset_values["box_cost"], step=0.1)
+        
+        total_shipping_cost_per_rental = shipping_cost + box_cost
+        st.markdown(f"**Total Shipping Cost per Rental: £{total_shipping_cost_per_rental:.2f}** (Postage: £{shipping_cost:.2f} + Box: £{box_cost:.2f})")
+        
+        processing_fee = st.number_input("Payment Processing Fee (%)", min_value=0.0, value=preset_values["processing_fee"], step=0.1)
+        
+        st.form_submit_button("Apply changes", type="primary", use_container_width=True)
 
     # Additional Costs Section
     st.subheader("3. Additional Costs")
@@ -246,44 +376,7 @@ with st.sidebar:
     if 'additional_costs' not in st.session_state:
         st.session_state.additional_costs = []
     
-    # Add new cost button
-    if st.button("➕ Add Additional Cost"):
-        st.session_state.additional_costs.append({"amount": 0.0, "note": ""})
-    
-    # Display existing additional costs
-    additional_costs_total = 0.0
-    costs_to_remove = []
-    
-    for i, cost in enumerate(st.session_state.additional_costs):
-        col1, col2, col3 = st.columns([1, 2, 0.5])
-        with col1:
-            new_amount = st.number_input(f"Amount (£)", min_value=0.0, value=cost["amount"], step=10.0, key=f"cost_amount_{i}")
-            st.session_state.additional_costs[i]["amount"] = new_amount
-        with col2:
-            new_note = st.text_input(f"Description", value=cost["note"], key=f"cost_note_{i}")
-            st.session_state.additional_costs[i]["note"] = new_note
-        with col3:
-            if st.button("🗑️", key=f"remove_cost_{i}"):
-                costs_to_remove.append(i)
-        
-        additional_costs_total += new_amount
-    
-    # Remove costs that were marked for deletion
-    for index in reversed(costs_to_remove):
-        st.session_state.additional_costs.pop(index)
-        st.rerun()
-    
-    # Display total additional costs
-    if additional_costs_total > 0:
-        st.markdown(f"**Total Additional Costs: £{additional_costs_total:,.2f}**")
-    
-    # Display additional costs breakdown
-    if st.session_state.additional_costs:
-        st.markdown("**Additional Costs Breakdown:**")
-        for i, cost in enumerate(st.session_state.additional_costs):
-            if cost["amount"] > 0:
-                note_display = cost["note"] if cost["note"] else "No description"
-                st.markdown(f"- £{cost['amount']:,.2f}: {note_display}")
+    render_additional_costs()
 
 # Main content area
 col1, col2 = st.columns([2, 1])
@@ -325,38 +418,36 @@ with col1:
         st.success("✅ Rental mix percentages are valid!")
 
 # Calculations
-def calculate_financials():
+@st.cache_data(max_entries=32)
+def calculate_financials(flip_qty, flip_cost, mini4_qty, mini4_cost, case_cost_per_unit, battery_cost, filter_cost,
+                         web_cost, legal_cost, platform_cost, domain_cost, insurance_cost, caa_cost, marketing_cost,
+                         repairs_cost, shipping_cost, box_cost, processing_fee, accountant_cost,
+                         flip_daily, flip_weekend, flip_weekly, mini4_daily, mini4_weekend, mini4_weekly,
+                         mix_daily, mix_weekend, mix_weekly, additional_costs_total):
     # Capital Expenditure
     total_drones = flip_qty + mini4_qty
+    total_hard_cases_cost = total_drones * case_cost_per_unit
     capex = (flip_qty * flip_cost) + (mini4_qty * mini4_cost) + total_hard_cases_cost + battery_cost + filter_cost + web_cost + legal_cost
     
     # SD Cards (1 per drone)
-    sd_card_cost_per_unit = 38.99
-    total_sd_card_cost = total_drones * sd_card_cost_per_unit
+    total_sd_card_cost = total_drones * SD_CARD_UNIT_COST
     capex += total_sd_card_cost
     
-    # Additional Costs
-    additional_costs_total = sum(cost["amount"] for cost in st.session_state.get('additional_costs', []))
-    
     # Operational Expenditure
     opex = platform_cost + domain_cost + insurance_cost + caa_cost + marketing_cost + repairs_cost + accountant_cost
     total_first_year_costs = capex + opex + additional_costs_total
     
-    # Revenue & Margin
-    mix_daily_pct = mix_daily / 100.0
-    mix_weekend_pct = mix_weekend / 100.0
-    mix_weekly_pct = mix_weekly / 100.0
-    
-    flip_avg_rev = (flip_daily * mix_daily_pct) + (flip_weekend * mix_weekend_pct) + (flip_weekly * mix_weekly_pct)
-    mini4_avg_rev = (mini4_daily * mix_daily_pct) + (mini4_weekend * mix_weekend_pct) + (mini4_weekly * mix_weekly_pct)
-    
-    flip_ratio = flip_qty / total_drones if total_drones > 0 else 0
-    mini4_ratio = mini4_qty / total_drones if total_drones > 0 else 0
+    # Revenue & Margin: per-drone average revenue is the price matrix (drone x rental type) times the
+    # rental mix, weighted by each drone's share of the fleet
+    prices = np.array([[flip_daily, flip_weekend, flip_weekly],
+                       [mini4_daily, mini4_weekend, mini4_weekly]])
+    mix = np.array([mix_daily, mix_weekend, mix_weekly]) / 100.0
+    fleet_share = np.array([flip_qty, mini4_qty]) / total_drones if total_drones > 0 else np.zeros(2)
     
-    weighted_avg_revenue = (flip_avg_rev * flip_ratio) + (mini4_avg_rev * mini4_ratio)
+    weighted_avg_revenue = float((prices @ mix) @ fleet_share)
     
     processing_cost = weighted_avg_revenue * (processing_fee / 100.0)
-    variable_cost_per_rental = total_shipping_cost_per_rental + processing_cost
+    variable_cost_per_rental = shipping_cost + box_cost + processing_cost
     contribution_margin = weighted_avg_revenue - variable_cost_per_rental
     
     # Break-Even Analysis
@@ -377,161 +468,511 @@ def calculate_financials():
         'capex': capex
     }
 
-# Function to create comprehensive data export
-def create_export_data(results):
-    # Get additional costs
-    additional_costs = st.session_state.get('additional_costs', [])
-    additional_costs_total = sum(cost["amount"] for cost in additional_costs)
+# Annual projection at a utilisation rate (a scalar or an array of rates); profit includes capex
+def calculate_projection(results, utilisation):
+    rental_days = results['total_available_days'] * (utilisation / 100.0)
+    total_revenue = rental_days * results['weighted_avg_revenue']
+    total_variable_costs = rental_days * results['variable_cost_per_rental']
+    profit = total_revenue - results['opex'] - total_variable_costs - results['capex']
+    return {'rental_days': rental_days, 'revenue': total_revenue, 'profit': profit}
+
+# Monthly projections for several utilisation rates at once (vectorized over the rates)
+def calculate_monthly_projections(results, utilisation_rates):
+    rental_days = results['total_available_days'] * (utilisation_rates / 100.0)
+    total_revenue = rental_days * results['weighted_avg_revenue']
+    total_variable_costs = rental_days * results['variable_cost_per_rental']
+    
+    # Calculate monthly values
+    monthly_revenue = total_revenue / 12.0
+    monthly_variable_costs = total_variable_costs / 12.0
+    monthly_operational_costs = results['opex'] / 12.0
+    
+    # Monthly profit EXCLUDES capital expenditure (one-time cost)
+    monthly_profit = monthly_revenue - monthly_variable_costs - monthly_operational_costs
+    monthly_rental_days = rental_days / 12.0
+    
+    # Calculate actual rentals per month (assuming average rental duration)
+    # Based on rental mix: 20% daily, 60% weekend, 20% weekly
+    avg_rental_duration = (0.2 * 1) + (0.6 * 2) + (0.2 * 7)  # weighted average days per rental
+    monthly_rentals = monthly_rental_days / avg_rental_duration
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        monthly_margin = np.where(monthly_revenue > 0, monthly_profit / monthly_revenue * 100, 0.0)
+    
+    return {
+        'monthly_revenue': monthly_revenue,
+        'monthly_profit': monthly_profit,
+        'monthly_rental_days': monthly_rental_days,
+        'monthly_rentals': monthly_rentals,
+        'monthly_variable_costs': monthly_variable_costs,
+        'monthly_operational_costs': monthly_operational_costs,
+        'monthly_margin': monthly_margin,
+        'annual_revenue': total_revenue,
+        'annual_profit': monthly_profit * 12,  # Annual profit excluding capex
+        'avg_rental_duration': avg_rental_duration
+    }
+
+# VAT analysis at the 20% utilisation base case
+@st.cache_data(max_entries=32)
+def calculate_vat_analysis(results, inputs, additional_costs):
+    vat_rate = 0.20  # 20% UK VAT rate
+    
+    # Calculate actual annual values based on utilisation
+    # For VAT analysis, we'll use 20% utilisation as the base case
+    base_utilisation = 20.0  # 20% utilisation rate
+    actual_rental_days = results['total_available_days'] * (base_utilisation / 100.0)
+    actual_annual_revenue = results['weighted_avg_revenue'] * actual_rental_days
+    
+    # VAT on Revenue (assuming all revenue is VATable)
+    total_revenue_vat = actual_annual_revenue * vat_rate
+    
+    # VAT-deductible items (business expenses) - these are annual costs
+    vat_deductible_items = {
+        'DJI Flips': inputs['flip_qty'] * inputs['flip_cost'] * vat_rate,
+        'DJI Mini 4 Pros': inputs['mini4_qty'] * inputs['mini4_cost'] * vat_rate,
+        'Hard Cases': (inputs['flip_qty'] + inputs['mini4_qty']) * inputs['case_cost_per_unit'] * vat_rate,
+        'SD Cards': (inputs['flip_qty'] + inputs['mini4_qty']) * SD_CARD_UNIT_COST * vat_rate,
+        'Extra Batteries': inputs['battery_cost'] * vat_rate,
+        'ND Filters': inputs['filter_cost'] * vat_rate,
+        'Website Setup': inputs['web_cost'] * vat_rate,
+        'Legal Fees': inputs['legal_cost'] * vat_rate,
+        'E-commerce Platform': inputs['platform_cost'] * vat_rate,
+        'Domain & Hosting': inputs['domain_cost'] * vat_rate,
+        'Corporate Insurance': inputs['insurance_cost'] * vat_rate,
+        'CAA Renewal': inputs['caa_cost'] * vat_rate,
+        'Digital Marketing': inputs['marketing_cost'] * vat_rate,
+        'Repairs & Maintenance': inputs['repairs_cost'] * vat_rate,
+        'Shipping Supplies': inputs['shipping_cost'] * vat_rate,
+        'Cardboard Boxes': inputs['box_cost'] * vat_rate,
+        'Accountant Costs': inputs['accountant_cost'] * 12 * vat_rate  # Annual accountant costs
+    }
+    # Drop zero-VAT items so consumers don't need to filter them again
+    vat_deductible_items = {item: amount for item, amount in vat_deductible_items.items() if amount > 0}
+    
+    # Additional costs VAT
+    additional_costs_vat = sum(amount * vat_rate for amount, _ in additional_costs)
+    
+    total_vat_deductible = sum(vat_deductible_items.values()) + additional_costs_vat
+    
+    # Net VAT payable (VAT on revenue - VAT deductible)
+    net_vat_payable = total_revenue_vat - total_vat_deductible
+    
+    # Calculate actual profit based on utilisation
+    actual_annual_profit = actual_annual_revenue - (results['variable_cost_per_rental'] * actual_rental_days) - results['opex'] - results['capex']
+    profit_after_vat = actual_annual_profit - net_vat_payable
+    
+    # VAT registration threshold analysis
+    vat_threshold = 85000  # UK VAT registration threshold
+    months_to_threshold = (vat_threshold / actual_annual_revenue * 12) if actual_annual_revenue > 0 else float('inf')
+    
+    return {
+        'vat_rate': vat_rate,
+        'total_revenue_vat': total_revenue_vat,
+        'vat_deductible_items': vat_deductible_items,
+        'total_vat_deductible': total_vat_deductible,
+        'net_vat_payable': net_vat_payable,
+        'profit_before_vat': actual_annual_profit,
+        'profit_after_vat': profit_after_vat,
+        'vat_threshold': vat_threshold,
+        'annual_revenue': actual_annual_revenue,
+        'months_to_threshold': months_to_threshold,
+        'additional_costs_vat': additional_costs_vat,
+        'actual_rental_days': actual_rental_days,
+        'base_utilisation': base_utilisation
+    }
+
+# VAT-deductible items table for the VAT tab, keyed on the (item, VAT amount) pairs it shows.
+# Shared rather than copied on a cache hit, so it must be treated as read-only
+@st.cache_resource(max_entries=32)
+def build_vat_breakdown(vat_deductible_items, additional_costs_vat):
+    items = [item for item, _ in vat_deductible_items]
+    vat_amounts = [vat_amount for _, vat_amount in vat_deductible_items]
+    
+    # Add additional costs VAT
+    if additional_costs_vat > 0:
+        items.append('Additional Costs')
+        vat_amounts.append(additional_costs_vat)
+    
+    # Raw values; the VAT tab formats them with column_config so the amounts stay sortable
+    return pd.DataFrame({
+        'Item': items,
+        'VAT Amount (£)': np.array(vat_amounts, dtype=np.float64),
+        'VAT Rate': 20,
+        'Deductible': True
+    })
+
+# Business planning metrics: ROI, payback, cash flow, sensitivity and risk scenarios
+@st.cache_data(max_entries=32)
+def calculate_business_metrics(results, utilisation_rates=None):
+    # If no utilisation rates provided, use default ones including break-even
+    if utilisation_rates is None:
+        # Get break-even utilisation and ensure it's included in the analysis
+        break_even_util = results['break_even_utilisation']
+        base_rates = [15, 20, 30]
+        
+        # Add break-even utilisation if it's not already in the base rates
+        # Round to nearest 5% for cleaner display
+        rounded_break_even = round(break_even_util / 5) * 5
+        if rounded_break_even not in base_rates and 10 <= rounded_break_even <= 50:
+            utilisation_rates = sorted(base_rates + [rounded_break_even])
+        else:
+            utilisation_rates = base_rates
+    """
+    Calculate business planning metrics with two different approaches:
+    1. ROI & Payback: Include capex to measure return on total investment
+    2. Cash Flow: Exclude capex to measure ongoing operational cash generation
+    """
+    metrics = {}
+    
+    # ROI and Payback Period calculations
+    initial_investment = results['total_first_year_costs']
+    
+    # Project every utilisation rate in one vectorized pass
+    rates = np.asarray(utilisation_rates, dtype=np.float64)
+    # Annual profit includes capex for ROI/payback calculations
+    annual_profits = calculate_projection(results, rates)['profit']
+    # Cash flow excludes capex to measure ongoing operational cash generation,
+    # using the same logic as calculate_monthly_projections
+    monthly_profits = calculate_monthly_projections(results, rates)['monthly_profit']
+    
+    # ROI = (Annual Profit / Initial Investment) * 100
+    rois = annual_profits / initial_investment * 100 if initial_investment > 0 else np.zeros_like(annual_profits)
+    
+    # Payback Period = Initial Investment / Annual Profit
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payback_years = np.where(annual_profits > 0, initial_investment / annual_profits, np.inf)
+    
+    # Tables are kept column-oriented (one list per column) so they load straight into DataFrames
+    utilisation_labels = [f"{util}%" for util in utilisation_rates]
+    
+    metrics['roi_data'] = {
+        'Utilisation': utilisation_labels,
+        'ROI': rois.tolist(),
+        'Annual Profit': annual_profits.tolist(),
+        'Initial Investment': [initial_investment] * len(utilisation_labels)
+    }
+    
+    metrics['payback_data'] = {
+        'Utilisation': utilisation_labels,
+        'Payback Years': payback_years.tolist(),
+        'Payback Months': (payback_years * 12).tolist(),
+        'Annual Profit': annual_profits.tolist()
+    }
+    
+    # Monthly cash flow is the same as monthly profit (excluding capex)
+    metrics['cash_flow_data'] = {
+        'Utilisation': utilisation_labels,
+        'Monthly Cash Flow': monthly_profits.tolist(),
+        'Annual Cash Flow': (monthly_profits * 12).tolist(),
+        'Monthly Profit': monthly_profits.tolist()
+    }
+    
+    # Sensitivity Analysis
+    base_utilisation = 20  # Base case
+    base_proj = calculate_projection(results, base_utilisation)
+    base_profit = base_proj['profit']
+    
+    # Test different scenarios
+    scenarios = [
+        ('Revenue -10%', 0.9, 1.0),
+        ('Revenue -5%', 0.95, 1.0),
+        ('Base Case', 1.0, 1.0),
+        ('Revenue +5%', 1.05, 1.0),
+        ('Revenue +10%', 1.10, 1.0),
+        ('Costs +10%', 1.0, 1.1),
+        ('Costs +5%', 1.0, 1.05),
+        ('Costs -5%', 1.0, 0.95),
+        ('Costs -10%', 1.0, 0.9)
+    ]
+    scenario_names, revenue_mults, cost_mults = zip(*scenarios)
+    revenue_mults = np.array(revenue_mults)
+    cost_mults = np.array(cost_mults)
+    
+    # Revenue scenarios scale revenue and variable costs; the rest (including the base case) scale opex
+    revenue_profits = (base_proj['revenue'] * revenue_mults - results['opex']
+                       - (base_proj['revenue'] - base_profit - results['opex']) * revenue_mults - results['capex'])
+    cost_profits = base_profit - (results['opex'] * (cost_mults - 1))
+    adjusted_profits = np.where(revenue_mults != 1.0, revenue_profits, cost_profits)
+    
+    profit_changes = ((adjusted_profits - base_profit) / base_profit * 100) if base_profit != 0 else np.zeros_like(adjusted_profits)
+    
+    metrics['sensitivity_data'] = {
+        'Scenario': list(scenario_names),
+        'Adjusted Profit': adjusted_profits.tolist(),
+        'Profit Change %': profit_changes.tolist()
+    }
+    
+    # Risk Assessment: worst, expected and best case projected in one vectorized pass
+    risk_cases = (
+        ('Worst Case (10% Utilisation)', 10),
+        ('Expected Case (20% Utilisation)', 20),
+        ('Best Case (40% Utilisation)', 40)
+    )
+    risk_rates = np.array([util for _, util in risk_cases], dtype=np.float64)
+    risk_profits = calculate_projection(results, risk_rates)['profit'].tolist()
+    
+    risk_metrics = {}
+    for (case_name, _), profit in zip(risk_cases, risk_profits):
+        risk_metrics[case_name] = {
+            'Annual Profit': profit,
+            'ROI': (profit / initial_investment * 100) if initial_investment > 0 else 0,
+            'Payback Years': initial_investment / profit if profit > 0 else float('inf')
+        }
+    
+    metrics['risk_metrics'] = risk_metrics
+    
+    return metrics
+
+# Function to create comprehensive data export. The DataFrames are shared rather than copied on every
+# cache hit (st.cache_resource), so callers must treat them as read-only
+@st.cache_resource(max_entries=32)
+def create_export_data(results, inputs, additional_costs):
+    total_drones = inputs['flip_qty'] + inputs['mini4_qty']
     
     # Create multiple dataframes for different sections
     
     # 1. Input Parameters
-    inputs_data = {
-        'Category': [
-            'Capital Expenditure', 'Capital Expenditure', 'Capital Expenditure', 'Capital Expenditure',
-            'Capital Expenditure', 'Capital Expenditure', 'Capital Expenditure', 'Capital Expenditure',
-            'Capital Expenditure', 'Capital Expenditure', 'Operational Costs', 'Operational Costs', 'Operational Costs', 'Operational Costs',
-            'Operational Costs', 'Operational Costs', 'Operational Costs', 'Operational Costs', 'Operational Costs',
-            'Pricing Strategy', 'Pricing Strategy', 'Pricing Strategy', 'Pricing Strategy',
-            'Pricing Strategy', 'Pricing Strategy', 'Pricing Strategy', 'Pricing Strategy',
-            'Pricing Strategy', 'Pricing Strategy', 'Pricing Strategy'
-        ],
-        'Parameter': [
-            'DJI Flips Quantity', 'DJI Flip Cost per Unit', 'DJI Mini 4 Pros Quantity', 'DJI Mini 4 Pro Cost per Unit',
-            'Hard Case Cost per Unit', 'Extra Batteries Cost', 'ND Filters Cost', 'Website Setup Cost',
-            'SD Cards Cost', 'Legal Fees', 'E-commerce Platform', 'Domain & Hosting',
-            'Corporate Insurance', 'CAA Renewal', 'Digital Marketing', 'Repairs & Maintenance', 'Accountant Costs (Monthly)', 'Shipping Supplies',
-            'Shipping Cost per Rental', 'DJI Flip Daily Price', 'DJI Flip Weekend Price', 'DJI Flip Weekly Price',
-            'DJI Mini 4 Pro Daily Price', 'DJI Mini 4 Pro Weekend Price', 'DJI Mini 4 Pro Weekly Price',
-            'Rental Mix Daily %', 'Rental Mix Weekend %', 'Rental Mix Weekly %', 'Payment Processing Fee %'
-        ],
-        'Value': [
-            flip_qty, flip_cost, mini4_qty, mini4_cost,
-            case_cost_per_unit, battery_cost, filter_cost, web_cost,
-            (flip_qty + mini4_qty) * 38.99, legal_cost, platform_cost, domain_cost,
-            insurance_cost, caa_cost, marketing_cost, repairs_cost, accountant_cost, shipping_cost, total_shipping_cost_per_rental,
-            flip_daily, flip_weekend, flip_weekly,
-            mini4_daily, mini4_weekend, mini4_weekly,
-            mix_daily, mix_weekend, mix_weekly, processing_fee
-        ],
-        'Unit': [
-            'units', '£', 'units', '£',
-            '£', '£', '£', '£',
-            '£', '£', '£', '£',
-            '£', '£', '£', '£', '£',
-            '£', '£', '£',
-            '£', '£', '£',
-            '%', '%', '%', '%'
-        ]
+    values = {
+        **inputs,
+        'sd_card_total': total_drones * SD_CARD_UNIT_COST,
+        'shipping_per_rental': inputs['shipping_cost'] + inputs['box_cost'],
     }
+    inputs_rows = [(category, parameter, values[key], unit) for category, parameter, key, unit in _INPUT_ROWS]
     
     # Add additional costs to inputs data
-    for i, cost in enumerate(additional_costs):
-        if cost["amount"] > 0:
-            inputs_data['Category'].append('Additional Costs')
-            inputs_data['Parameter'].append(f"Additional Cost {i+1}: {cost['note']}" if cost['note'] else f"Additional Cost {i+1}")
-            inputs_data['Value'].append(cost["amount"])
-            inputs_data['Unit'].append('£')
-    
-    # Ensure all arrays have the same length by adding empty entries if needed
-    base_length = len(inputs_data['Category'])
-    for key in inputs_data:
-        while len(inputs_data[key]) < base_length:
-            if key == 'Category':
-                inputs_data[key].append('Additional Costs')
-            elif key == 'Parameter':
-                inputs_data[key].append('')
-            elif key == 'Value':
-                inputs_data[key].append(0.0)
-            elif key == 'Unit':
-                inputs_data[key].append('£')
+    inputs_rows.extend(
+        ('Additional Costs', f"Additional Cost {i+1}: {note}" if note else f"Additional Cost {i+1}", amount, '£')
+        for i, (amount, note) in enumerate(additional_costs) if amount > 0
+    )
     
     # 2. Key Metrics
-    metrics_data = {
-        'Metric': [
-            'Total First-Year Costs', 'Weighted Average Revenue per Day', 'Contribution Margin per Day',
-            'Break-Even Days', 'Break-Even Utilisation Rate', 'Total Drones', 'Total Available Days',
-            'Variable Cost per Rental', 'Annual Operational Costs', 'Capital Expenditure'
-        ],
-        'Value': [
-            results['total_first_year_costs'], results['weighted_avg_revenue'], results['contribution_margin'],
-            results['break_even_days'], results['break_even_utilisation'], results['total_drones'],
-            results['total_available_days'], results['variable_cost_per_rental'], results['opex'], results['capex']
-        ],
-        'Unit': [
-            '£', '£', '£', 'days', '%', 'units', 'days', '£', '£', '£'
-        ]
+    metrics_rows = [(metric, results[key], unit) for metric, key, unit in _METRIC_ROWS]
+    
+    # 3. Detailed Projections (vectorized across all utilisation rates)
+    utilisation_rates = np.arange(10, 51, 5)
+    projections = calculate_projection(results, utilisation_rates)
+    rental_days, revenue, profit = projections['rental_days'], projections['revenue'], projections['profit']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        profit_margin = np.where(revenue > 0, profit / revenue * 100.0, 0.0)
+    
+    projections_data = {
+        'Utilisation Rate (%)': utilisation_rates,
+        'Rental Days': rental_days,
+        'Annual Revenue (£)': revenue,
+        'Annual Profit (£)': profit,
+        'Profit Margin (%)': profit_margin
     }
     
-    # 3. Detailed Projections
-    def calculate_projection(utilisation):
-        rental_days = results['total_available_days'] * (utilisation / 100.0)
-        total_revenue = rental_days * results['weighted_avg_revenue']
-        total_variable_costs = rental_days * results['variable_cost_per_rental']
-        profit = total_revenue - results['opex'] - total_variable_costs - results['capex']
-        return {'revenue': total_revenue, 'profit': profit, 'rental_days': rental_days}
-    
-    utilisation_rates = [10, 15, 20, 25, 30, 35, 40, 45, 50]
-    projections_data = []
-    
-    for util in utilisation_rates:
-        proj = calculate_projection(util)
-        projections_data.append({
-            'Utilisation Rate (%)': util,
-            'Rental Days': proj['rental_days'],
-            'Annual Revenue (£)': proj['revenue'],
-            'Annual Profit (£)': proj['profit'],
-            'Profit Margin (%)': (proj['profit'] / proj['revenue'] * 100.0) if proj['revenue'] > 0 else 0
-        })
-    
     # 4. Cost Breakdown
-    cost_breakdown_data = {
-        'Cost Category': [
-            'DJI Flips', 'DJI Mini 4 Pros', 'SD Cards', 'Hard Cases', 'Extra Batteries', 'ND Filters',
-            'Website & Legal', 'E-commerce Platform', 'Domain & Hosting', 'Insurance & CAA',
-            'Marketing', 'Repairs & Maintenance', 'Accountant Costs', 'Shipping Supplies'
-        ],
-        'Amount (£)': [
-            flip_qty * flip_cost, mini4_qty * mini4_cost, (flip_qty + mini4_qty) * 38.99, total_hard_cases_cost,
-            battery_cost, filter_cost, web_cost + legal_cost, platform_cost, domain_cost, insurance_cost + caa_cost,
-            marketing_cost, repairs_cost, accountant_cost * 12, shipping_cost
-        ],
-        'Type': [
-            'Capital', 'Capital', 'Capital', 'Capital', 'Capital', 'Capital',
-            'Capital', 'Operational', 'Operational', 'Operational',
-            'Operational', 'Operational', 'Operational', 'Operational'
-        ]
-    }
+    cost_breakdown_rows = [
+        ('DJI Flips', inputs['flip_qty'] * inputs['flip_cost'], 'Capital'),
+        ('DJI Mini 4 Pros', inputs['mini4_qty'] * inputs['mini4_cost'], 'Capital'),
+        ('SD Cards', total_drones * SD_CARD_UNIT_COST, 'Capital'),
+        ('Hard Cases', total_drones * inputs['case_cost_per_unit'], 'Capital'),
+        ('Extra Batteries', inputs['battery_cost'], 'Capital'),
+        ('ND Filters', inputs['filter_cost'], 'Capital'),
+        ('Website & Legal', inputs['web_cost'] + inputs['legal_cost'], 'Capital'),
+        ('E-commerce Platform', inputs['platform_cost'], 'Operational'),
+        ('Domain & Hosting', inputs['domain_cost'], 'Operational'),
+        ('Insurance & CAA', inputs['insurance_cost'] + inputs['caa_cost'], 'Operational'),
+        ('Marketing', inputs['marketing_cost'], 'Operational'),
+        ('Repairs & Maintenance', inputs['repairs_cost'], 'Operational'),
+        ('Accountant Costs', inputs['accountant_cost'] * 12, 'Operational'),
+        ('Shipping Supplies', inputs['shipping_cost'], 'Operational')
+    ]
     
     # Add additional costs to cost breakdown
-    for i, cost in enumerate(additional_costs):
-        if cost["amount"] > 0:
-            cost_breakdown_data['Cost Category'].append(f"Additional Cost {i+1}: {cost['note']}" if cost['note'] else f"Additional Cost {i+1}")
-            cost_breakdown_data['Amount (£)'].append(cost["amount"])
-            cost_breakdown_data['Type'].append('Additional')
+    cost_breakdown_rows.extend(
+        (f"Additional Cost {i+1}: {note}" if note else f"Additional Cost {i+1}", amount, 'Additional')
+        for i, (amount, note) in enumerate(additional_costs) if amount > 0
+    )
     
     return {
-        'inputs': pd.DataFrame(inputs_data),
-        'metrics': pd.DataFrame(metrics_data),
+        'inputs': pd.DataFrame.from_records(inputs_rows, columns=['Category', 'Parameter', 'Value', 'Unit']),
+        'metrics': pd.DataFrame.from_records(metrics_rows, columns=['Metric', 'Value', 'Unit']),
         'projections': pd.DataFrame(projections_data),
-        'cost_breakdown': pd.DataFrame(cost_breakdown_data)
+        'cost_breakdown': pd.DataFrame.from_records(cost_breakdown_rows, columns=['Cost Category', 'Amount (£)', 'Type'])
     }
 
-# Function to generate comprehensive PDF report
-def generate_pdf_report(results, vat_analysis, business_metrics, export_data, preset_name):
-    """
-    Generate a comprehensive PDF business plan report
-    """
-    # Create temporary file for PDF
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-        pdf_path = tmp_file.name
+# Function to serialize each export section to UTF-8 CSV bytes exactly once
+@st.cache_data(max_entries=32)
+def create_section_csvs(export_data):
+    section_csvs = {}
+    for section, df in export_data.items():
+        output = io.BytesIO()
+        df.to_csv(output, index=False, encoding='utf-8', lineterminator='\n')
+        section_csvs[section] = output.getvalue()
+    return section_csvs
+
+# Function to create a comprehensive CSV with all data
+@st.cache_data(max_entries=32)
+def create_comprehensive_csv(section_csvs, generated_on):
+    return b"".join([
+        # Header
+        b"AERORENT UK - FINANCIAL CALCULATOR EXPORT\n",
+        f"Generated on: {generated_on}\n".encode('utf-8'),
+        b"=" * 50 + b"\n\n",
+        
+        # Inputs
+        b"INPUT PARAMETERS\n",
+        b"-" * 20 + b"\n",
+        section_csvs['inputs'],
+        b"\n\n",
+        
+        # Key metrics
+        b"KEY METRICS\n",
+        b"-" * 12 + b"\n",
+        section_csvs['metrics'],
+        b"\n\n",
+        
+        # Projections
+        b"ANNUAL PROJECTIONS\n",
+        b"-" * 18 + b"\n",
+        section_csvs['projections'],
+        b"\n\n",
+        
+        # Cost breakdown
+        b"COST BREAKDOWN\n",
+        b"-" * 14 + b"\n",
+        section_csvs['cost_breakdown']
+    ])
+
+# Revenue & profit vs utilisation chart, keyed on the scalars that move the curves. The Figure itself is
+# cached (not a dict) because st.plotly_chart only re-validates dicts and serializes a Figure as-is
+@st.cache_resource(max_entries=32)
+def build_revenue_fig(total_available_days, weighted_avg_revenue, variable_cost_per_rental, opex, capex):
+    _load_plotly()
+    utilisation_range = np.arange(10, 51, 5, dtype=np.int32)
+    rental_days = total_available_days * (utilisation_range / 100.0)
+    revenue_data = rental_days * weighted_avg_revenue
+    profit_data = revenue_data - opex - rental_days * variable_cost_per_rental - capex
+    # float32 is ample for display-only pounds and halves the serialized trace payload
+    revenue_data = revenue_data.astype(np.float32)
+    profit_data = profit_data.astype(np.float32)
+    
+    fig_revenue = go.Figure(
+        data=[
+            go.Scatter(
+                x=utilisation_range,
+                y=revenue_data,
+                mode='lines+markers',
+                name='Annual Revenue',
+                line=dict(color='#4f46e5', width=3)
+            ),
+            go.Scatter(
+                x=utilisation_range,
+                y=profit_data,
+                mode='lines+markers',
+                name='Annual Profit',
+                line=dict(color='#059669', width=3)
+            )
+        ],
+        layout=dict(
+            title='Revenue & Profit vs Utilisation Rate',
+            xaxis_title='Utilisation Rate (%)',
+            yaxis_title='Amount (£)',
+            hovermode='x unified',
+            height=400,
+            uirevision='revenue',
+            transition_duration=0
+        )
+    )
     
-    # Create PDF document
-    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
-    story = []
+    return fig_revenue
+
+# Slice labels for the cost breakdown pie, in the order build_cost_pie takes its arguments
+_COST_PIE_LABELS = ('DJI Flips', 'DJI Mini 4 Pros', 'Hard Cases', 'SD Cards', 'Batteries & Filters', 'Website & Legal', 'Annual Opex')
+
+# Cost breakdown pie chart, cached as a Figure keyed on the cost totals
+@st.cache_resource(max_entries=32)
+def build_cost_pie(flips, mini4s, hard_cases, sd_cards, batteries_filters, web_legal, opex):
+    _load_plotly()
+    # Zero-cost categories would only add empty slices; each label keeps its own colour either way
+    slices = [
+        (label, value)
+        for label, value in zip(_COST_PIE_LABELS, (flips, mini4s, hard_cases, sd_cards, batteries_filters, web_legal, opex))
+        if value > 0
+    ]
+    slice_colors = dict(zip(_COST_PIE_LABELS, plotly_colors.qualitative.Set3))
+    # Built directly as a go.Pie; plotly.express would add its own import and a ~17ms figure build
+    fig_costs = go.Figure(
+        data=[go.Pie(
+            labels=[label for label, _ in slices],
+            values=[value for _, value in slices],
+            marker_colors=[slice_colors[label] for label, _ in slices]
+        )],
+        layout=dict(
+            title='Cost Breakdown',
+            height=400,
+            uirevision='costs',
+            transition_duration=0
+        )
+    )
+    
+    return fig_costs
+
+# VAT composition pie and VAT-on-profit bars, cached as a Figure keyed on the VAT totals
+@st.cache_resource(max_entries=32)
+def build_vat_fig(total_revenue_vat, total_vat_deductible, net_vat_payable, profit_before_vat, profit_after_vat):
+    _load_plotly()
+    profit_values = (profit_before_vat, net_vat_payable, profit_after_vat)
+    
+    fig_vat = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'domain'}, {'type': 'xy'}]],
+        subplot_titles=('VAT Composition', 'VAT Impact on Daily Profit')
+    )
+    fig_vat.add_trace(go.Pie(
+        labels=('VAT on Revenue', 'VAT Deductible', 'Net VAT Payable'),
+        # Whole-pound int32 values keep the serialized chart payload small
+        values=np.array([round(v) for v in (total_revenue_vat, total_vat_deductible, net_vat_payable)], dtype=np.int32),
+        marker_colors=['#4f46e5', '#059669', '#dc2626']
+    ), row=1, col=1)
+    fig_vat.add_trace(go.Bar(
+        x=('Profit Before VAT', 'VAT Payable', 'Profit After VAT'),
+        y=np.array([round(v) for v in profit_values], dtype=np.int32),
+        marker_color=['#4f46e5', '#dc2626', '#059669'],
+        text=[f"£{v:,.0f}" for v in profit_values],
+        textposition='auto',
+        showlegend=False
+    ), row=1, col=2)
+    
+    fig_vat.update_yaxes(title_text='Amount (£)', row=1, col=2)
+    # A fixed uirevision keeps legend toggles across reruns; no transition when values change
+    fig_vat.update_layout(height=400, uirevision='vat', transition_duration=0)
+    
+    return fig_vat
+
+# Vega-Lite spec for a bar chart whose bars are coloured by sign, with a text label on each bar.
+# Plain dicts skip the Plotly figure validation that go.Figure/go.Bar pay on every rerun
+def signed_bar_spec(categories, values, labels, positive_color, title, x_title, y_title, label_angle=0):
+    bars = [
+        {'category': category, 'value': value, 'label': label}
+        for category, value, label in zip(categories, values, labels)
+    ]
+    # Bar colour is picked by sign in the browser, so the rows carry no per-bar colour
+    color = {'condition': {'test': 'datum.value > 0', 'value': positive_color}, 'value': '#dc2626'}
+    x = {'field': 'category', 'type': 'nominal', 'title': x_title, 'sort': None, 'axis': {'labelAngle': label_angle}}
+    y = {'field': 'value', 'type': 'quantitative', 'title': y_title}
+    return {
+        'title': title,
+        'height': 400,
+        'data': {'values': bars},
+        'layer': [
+            {'mark': 'bar', 'encoding': {'x': x, 'y': y, 'color': color}},
+            # Labels sit above positive bars and below negative ones, clear of the bar and the zero axis
+            {'mark': {'type': 'text', 'baseline': {'expr': "datum.value < 0 ? 'top' : 'bottom'"},
+                      'dy': {'expr': 'datum.value < 0 ? 4 : -4'}},
+             'encoding': {'x': x, 'y': y, 'text': {'field': 'label'}}}
+        ]
+    }
+
+# ReportLab styles never change, so build them once per process instead of on every report
+@st.cache_resource
+def _pdf_paragraph_styles():
+    _load_reportlab()
     styles = getSampleStyleSheet()
     
-    # Custom styles
     title_style = ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
@@ -567,13 +1008,71 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         textColor=colors.HexColor('#374151')
     )
     
+    return title_style, heading_style, subheading_style, normal_style
+
+# Report table palettes: (header colour, body colour, grid colour)
+_PDF_TABLE_PALETTES = {
+    'indigo': ('#4f46e5', '#f8fafc', '#e5e7eb'),
+    'green': ('#059669', '#f0fdf4', '#bbf7d0'),
+    'red': ('#dc2626', '#fef2f2', '#fecaca'),
+}
+
+@st.cache_resource
+def _pdf_table_style(palette, align='CENTER', header_font_size=10):
+    _load_reportlab()
+    header_color, body_color, grid_color = _PDF_TABLE_PALETTES[palette]
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), align),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), header_font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(body_color)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(grid_color))
+    ])
+
+# Styled report table: header row in the palette colour over a tinted, gridded body
+def _pdf_table(data, col_widths, palette, align='CENTER', header_font_size=10):
+    table = Table(data, colWidths=col_widths)
+    table.setStyle(_pdf_table_style(palette, align, header_font_size))
+    return table
+
+# Function to generate comprehensive PDF report (immutable bytes, so shared without copying).
+# The cache key is only what the report shows, including the generation date passed in by the
+# caller, so cached reports are reused within a day but never carry a stale date
+@st.cache_resource(max_entries=8, show_spinner=False)
+def generate_pdf_report(results, inputs, vat_analysis, business_metrics, preset_name, generated_on):
+    """
+    Generate a comprehensive PDF business plan report
+    """
+    _load_reportlab()
+    flip_qty, flip_cost, mini4_qty, mini4_cost = inputs['flip_qty'], inputs['flip_cost'], inputs['mini4_qty'], inputs['mini4_cost']
+    case_cost_per_unit, web_cost, legal_cost = inputs['case_cost_per_unit'], inputs['web_cost'], inputs['legal_cost']
+    platform_cost, domain_cost, insurance_cost, caa_cost = inputs['platform_cost'], inputs['domain_cost'], inputs['insurance_cost'], inputs['caa_cost']
+    marketing_cost, repairs_cost, accountant_cost = inputs['marketing_cost'], inputs['repairs_cost'], inputs['accountant_cost']
+    shipping_cost, box_cost = inputs['shipping_cost'], inputs['box_cost']
+    flip_daily, flip_weekend, flip_weekly = inputs['flip_daily'], inputs['flip_weekend'], inputs['flip_weekly']
+    mini4_daily, mini4_weekend, mini4_weekly = inputs['mini4_daily'], inputs['mini4_weekend'], inputs['mini4_weekly']
+    mix_daily, mix_weekend, mix_weekly = inputs['mix_daily'], inputs['mix_weekend'], inputs['mix_weekly']
+    total_hard_cases_cost = (flip_qty + mini4_qty) * case_cost_per_unit
+    
+    # Build the PDF in memory
+    pdf_buffer = io.BytesIO()
+    
+    # Create PDF document (compressed page streams; only the built-in Helvetica faces are used, so no fonts are embedded)
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72,
+                            pageCompression=1)
+    story = []
+    title_style, heading_style, subheading_style, normal_style = _pdf_paragraph_styles()
+    
     # Title Page
     story.append(Paragraph("🚁 AeroRent UK", title_style))
     story.append(Paragraph("Drone Rental Business Plan", title_style))
     if preset_name and preset_name != "Proposal 1" and preset_name != "Proposal 2":
         story.append(Paragraph(f"Report: {preset_name}", title_style))
     story.append(Spacer(1, 20))
-    story.append(Paragraph(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", normal_style))
+    story.append(Paragraph(f"Generated on: {generated_on}", normal_style))
     story.append(Paragraph(f"Configuration: {preset_name}", normal_style))
     story.append(PageBreak())
     
@@ -597,20 +1096,10 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['Weighted Average Revenue per Day', f"£{results['weighted_avg_revenue']:.2f}"],
         ['Contribution Margin per Day', f"£{results['contribution_margin']:.2f}"],
         ['Total Available Rental Days', f"{results['total_available_days']:,.0f}"],
-        ['Expected ROI (20% Utilisation)', f"{business_metrics['roi_data'][1]['ROI']:.1f}%"]
+        ['Expected ROI (20% Utilisation)', f"{business_metrics['roi_data']['ROI'][1]:.1f}%"]
     ]
     
-    key_metrics_table = Table(key_metrics_data, colWidths=[3*inch, 2*inch])
-    key_metrics_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-    ]))
+    key_metrics_table = _pdf_table(key_metrics_data, [3*inch, 2*inch], 'indigo', 'LEFT', 12)
     story.append(key_metrics_table)
     story.append(PageBreak())
     
@@ -624,21 +1113,11 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['DJI Flips', f"{flip_qty:.0f}", f"£{flip_cost:.2f}", f"£{flip_qty * flip_cost:.2f}"],
         ['DJI Mini 4 Pros', f"{mini4_qty:.0f}", f"£{mini4_cost:.2f}", f"£{mini4_qty * mini4_cost:.2f}"],
         ['Hard Cases', f"{flip_qty + mini4_qty:.0f}", f"£{case_cost_per_unit:.2f}", f"£{total_hard_cases_cost:.2f}"],
-        ['SD Cards', f"{flip_qty + mini4_qty:.0f}", "£38.99", f"£{(flip_qty + mini4_qty) * 38.99:.2f}"],
+        ['SD Cards', f"{flip_qty + mini4_qty:.0f}", f"£{SD_CARD_UNIT_COST}", f"£{(flip_qty + mini4_qty) * SD_CARD_UNIT_COST:.2f}"],
         ['Website & Legal', '1', f"£{web_cost + legal_cost:.2f}", f"£{web_cost + legal_cost:.2f}"]
     ]
     
-    equipment_table = Table(equipment_data, colWidths=[1.5*inch, 1*inch, 1.5*inch, 1.5*inch])
-    equipment_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-    ]))
+    equipment_table = _pdf_table(equipment_data, [1.5*inch, 1*inch, 1.5*inch, 1.5*inch], 'indigo')
     story.append(equipment_table)
     story.append(Spacer(1, 12))
     
@@ -650,17 +1129,7 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['DJI Mini 4 Pro', f"£{mini4_daily:.2f}", f"£{mini4_weekend:.2f}", f"£{mini4_weekly:.2f}"]
     ]
     
-    pricing_table = Table(pricing_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-    pricing_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fdf4')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
-    ]))
+    pricing_table = _pdf_table(pricing_data, [1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch], 'green')
     story.append(pricing_table)
     story.append(Spacer(1, 12))
     
@@ -683,17 +1152,7 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['Total Capex', f"£{results['capex']:,.2f}"]
     ]
     
-    capex_table = Table(capex_data, colWidths=[3*inch, 2*inch])
-    capex_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef2f2')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fecaca'))
-    ]))
+    capex_table = _pdf_table(capex_data, [3*inch, 2*inch], 'red', 'LEFT')
     story.append(capex_table)
     story.append(Spacer(1, 12))
     
@@ -709,17 +1168,7 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['Total Opex', f"£{results['opex']:,.2f}", f"£{results['opex'] / 12:,.2f}"]
     ]
     
-    opex_table = Table(opex_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-    opex_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef2f2')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fecaca'))
-    ]))
+    opex_table = _pdf_table(opex_data, [2*inch, 1.5*inch, 1.5*inch], 'red', 'LEFT')
     story.append(opex_table)
     story.append(Spacer(1, 12))
     
@@ -733,17 +1182,7 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['Total Variable Cost', f"£{results['variable_cost_per_rental']:.2f}"]
     ]
     
-    variable_costs_table = Table(variable_costs_data, colWidths=[3*inch, 2*inch])
-    variable_costs_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fdf4')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
-    ]))
+    variable_costs_table = _pdf_table(variable_costs_data, [3*inch, 2*inch], 'green', 'LEFT')
     story.append(variable_costs_table)
     story.append(PageBreak())
     
@@ -754,31 +1193,22 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
     story.append(Paragraph("📈 Annual Projections by Utilisation Rate", subheading_style))
     
     # Get projections data
-    projections_data = []
-    utilisation_rates = [20, results['break_even_utilisation'], 30, 40]
-    
-    for util in utilisation_rates:
-        if util > 0:
-            proj = calculate_projection(util)
-            projections_data.append([
-                f"{util:.1f}%",
-                f"£{proj['revenue']:,.0f}",
-                f"£{proj['profit']:,.0f}",
-                f"{(proj['profit'] / proj['revenue'] * 100):.1f}%" if proj['revenue'] > 0 else "0.0%"
-            ])
+    utilisation_rates = np.array([20, results['break_even_utilisation'], 30, 40], dtype=np.float64)
+    utilisation_rates = utilisation_rates[utilisation_rates > 0]
+    proj = calculate_projection(results, utilisation_rates)
+    
+    projections_data = [
+        [
+            f"{util:.1f}%",
+            f"£{revenue:,.0f}",
+            f"£{profit:,.0f}",
+            f"{(profit / revenue * 100):.1f}%" if revenue > 0 else "0.0%"
+        ]
+        for util, revenue, profit in zip(utilisation_rates, proj['revenue'], proj['profit'])
+    ]
     
     projections_table_data = [['Utilisation', 'Annual Revenue', 'Annual Profit', 'Profit Margin']] + projections_data
-    projections_table = Table(projections_table_data, colWidths=[1*inch, 1.5*inch, 1.5*inch, 1*inch])
-    projections_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-    ]))
+    projections_table = _pdf_table(projections_table_data, [1*inch, 1.5*inch, 1.5*inch, 1*inch], 'indigo')
     story.append(projections_table)
     story.append(Spacer(1, 12))
     
@@ -786,30 +1216,20 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
     story.append(Paragraph("📅 Monthly Projections", subheading_style))
     
     monthly_data = []
-    target_utilisation_rates = [15, 20, 30]
+    target_utilisation_rates = np.array([15, 20, 30])
+    monthly = calculate_monthly_projections(results, target_utilisation_rates)
     
-    for util in target_utilisation_rates:
-        proj = calculate_monthly_projection(util)
+    for util, rentals, revenue, profit, margin in zip(target_utilisation_rates, monthly['monthly_rentals'], monthly['monthly_revenue'], monthly['monthly_profit'], monthly['monthly_margin']):
         monthly_data.append([
             f"{util}%",
-            f"{proj['monthly_rentals']:.1f}",
-            f"£{proj['monthly_revenue']:,.0f}",
-            f"£{proj['monthly_profit']:,.0f}",
-            f"{(proj['monthly_profit'] / proj['monthly_revenue'] * 100):.1f}%" if proj['monthly_revenue'] > 0 else "0.0%"
+            f"{rentals:.1f}",
+            f"£{revenue:,.0f}",
+            f"£{profit:,.0f}",
+            f"{margin:.1f}%"
         ])
     
     monthly_table_data = [['Utilisation', 'Monthly Rentals', 'Monthly Revenue', 'Monthly Profit', 'Margin']] + monthly_data
-    monthly_table = Table(monthly_table_data, colWidths=[1*inch, 1.2*inch, 1.3*inch, 1.3*inch, 1.2*inch])
-    monthly_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fdf4')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
-    ]))
+    monthly_table = _pdf_table(monthly_table_data, [1*inch, 1.2*inch, 1.3*inch, 1.3*inch, 1.2*inch], 'green', 'CENTER', 9)
     story.append(monthly_table)
     story.append(PageBreak())
     
@@ -819,55 +1239,37 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
     # ROI Analysis
     story.append(Paragraph("📈 Return on Investment (ROI) Analysis", subheading_style))
     
+    roi_columns = business_metrics['roi_data']
     roi_data = []
-    for i, roi_data_item in enumerate(business_metrics['roi_data']):
-        payback_data_item = business_metrics['payback_data'][i]  # Get corresponding payback data
+    for util, roi, annual_profit, payback_years in zip(roi_columns['Utilisation'], roi_columns['ROI'], roi_columns['Annual Profit'],
+                                                       business_metrics['payback_data']['Payback Years']):
         roi_data.append([
-            roi_data_item['Utilisation'],
-            f"{roi_data_item['ROI']:.1f}%",
-            f"£{roi_data_item['Annual Profit']:,.0f}",
-            f"{payback_data_item['Payback Years']:.1f} years" if payback_data_item['Payback Years'] != float('inf') else "∞"
+            util,
+            f"{roi:.1f}%",
+            f"£{annual_profit:,.0f}",
+            f"{payback_years:.1f} years" if payback_years != float('inf') else "∞"
         ])
     
     roi_table_data = [['Utilisation', 'ROI', 'Annual Profit', 'Payback Period']] + roi_data
-    roi_table = Table(roi_table_data, colWidths=[1.2*inch, 1.2*inch, 1.5*inch, 1.1*inch])
-    roi_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-    ]))
+    roi_table = _pdf_table(roi_table_data, [1.2*inch, 1.2*inch, 1.5*inch, 1.1*inch], 'indigo')
     story.append(roi_table)
     story.append(Spacer(1, 12))
     
     # Cash Flow Analysis
     story.append(Paragraph("💰 Cash Flow Analysis", subheading_style))
     
+    cash_flow_columns = business_metrics['cash_flow_data']
     cash_flow_data = []
-    for data in business_metrics['cash_flow_data']:
+    for util, monthly_cash_flow, annual_cash_flow, monthly_profit in zip(*cash_flow_columns.values()):
         cash_flow_data.append([
-            data['Utilisation'],
-            f"£{data['Monthly Cash Flow']:,.0f}",
-            f"£{data['Annual Cash Flow']:,.0f}",
-            f"£{data['Monthly Profit']:,.0f}"
+            util,
+            f"£{monthly_cash_flow:,.0f}",
+            f"£{annual_cash_flow:,.0f}",
+            f"£{monthly_profit:,.0f}"
         ])
     
     cash_flow_table_data = [['Utilisation', 'Monthly Cash Flow', 'Annual Cash Flow', 'Monthly Profit']] + cash_flow_data
-    cash_flow_table = Table(cash_flow_table_data, colWidths=[1.2*inch, 1.5*inch, 1.5*inch, 1.3*inch])
-    cash_flow_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#059669')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fdf4')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbf7d0'))
-    ]))
+    cash_flow_table = _pdf_table(cash_flow_table_data, [1.2*inch, 1.5*inch, 1.5*inch, 1.3*inch], 'green')
     story.append(cash_flow_table)
     story.append(PageBreak())
     
@@ -889,17 +1291,7 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ])
     
     risk_table_data = [['Scenario', 'Annual Profit', 'ROI', 'Payback Period']] + risk_data
-    risk_table = Table(risk_table_data, colWidths=[2*inch, 1.5*inch, 1*inch, 1.5*inch])
-    risk_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef2f2')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fecaca'))
-    ]))
+    risk_table = _pdf_table(risk_table_data, [2*inch, 1.5*inch, 1*inch, 1.5*inch], 'red')
     story.append(risk_table)
     story.append(Spacer(1, 12))
     
@@ -907,25 +1299,15 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
     story.append(Paragraph("📊 Sensitivity Analysis", subheading_style))
     
     sensitivity_data = []
-    for data in business_metrics['sensitivity_data']:
+    for scenario, adjusted_profit, profit_change in zip(*business_metrics['sensitivity_data'].values()):
         sensitivity_data.append([
-            data['Scenario'],
-            f"£{data['Adjusted Profit']:,.0f}",
-            f"{data['Profit Change %']:+.1f}%"
+            scenario,
+            f"£{adjusted_profit:,.0f}",
+            f"{profit_change:+.1f}%"
         ])
     
     sensitivity_table_data = [['Scenario', 'Adjusted Profit', 'Profit Change']] + sensitivity_data
-    sensitivity_table = Table(sensitivity_table_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-    sensitivity_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4f46e5')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb'))
-    ]))
+    sensitivity_table = _pdf_table(sensitivity_table_data, [2*inch, 1.5*inch, 1.5*inch], 'indigo', 'CENTER', 9)
     story.append(sensitivity_table)
     story.append(PageBreak())
     
@@ -952,17 +1334,7 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
         ['VAT Registration Required', "Yes" if vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold'] else "No"]
     ]
     
-    vat_summary_table = Table(vat_summary_data, colWidths=[3*inch, 2*inch])
-    vat_summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef2f2')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fecaca'))
-    ]))
+    vat_summary_table = _pdf_table(vat_summary_data, [3*inch, 2*inch], 'red', 'LEFT')
     story.append(vat_summary_table)
     story.append(Spacer(1, 12))
     
@@ -972,16 +1344,16 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
     insights = [
         "🎯 **Break-Even Analysis**: The business requires " + f"{results['break_even_utilisation']:.1f}%" + " utilisation to break even in the first year.",
         "📈 **Growth Potential**: At 30% utilisation, the business generates significant positive cash flow.",
-        "💰 **Investment Appeal**: Expected ROI of " + f"{business_metrics['roi_data'][1]['ROI']:.1f}%" + " at 20% utilisation makes this an attractive investment.",
+        "💰 **Investment Appeal**: Expected ROI of " + f"{business_metrics['roi_data']['ROI'][1]:.1f}%" + " at 20% utilisation makes this an attractive investment.",
         "⚠️ **Risk Management**: Conservative estimates show the business remains viable even at 15% utilisation.",
         "🏛️ **VAT Considerations**: " + ("VAT registration is required" if vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold'] else "VAT registration threshold not reached") + " based on projected revenue.",
         "📊 **Market Positioning**: Competitive pricing strategy positions the business well in the UK drone rental market.",
         "🔄 **Operational Efficiency**: Fixed costs are well-controlled, with variable costs scaling appropriately with demand."
     ]
     
-    for insight in insights:
-        story.append(Paragraph(insight, normal_style))
-        story.append(Spacer(1, 6))
+    # One paragraph for all insights; the blank line matches the old 12pt gap (spaceAfter + Spacer)
+    story.append(Paragraph("<br/><br/>".join(insights), normal_style))
+    story.append(Spacer(1, 6))
     
     # Conclusion
     story.append(Paragraph("🎯 Conclusion", heading_style))
@@ -995,85 +1367,47 @@ def generate_pdf_report(results, vat_analysis, business_metrics, export_data, pr
     # Build PDF
     doc.build(story)
     
-    # Read the generated PDF
-    with open(pdf_path, 'rb') as pdf_file:
-        pdf_data = pdf_file.read()
-    
-    # Clean up temporary file
-    os.unlink(pdf_path)
-    
-    return pdf_data
+    return pdf_buffer.getvalue()
 
 if mix_total == 100.0:
-    results = calculate_financials()
-    
-    # Calculate VAT analysis
-    def calculate_vat_analysis(results):
-        vat_rate = 0.20  # 20% UK VAT rate
-        
-        # Calculate actual annual values based on utilisation
-        # For VAT analysis, we'll use 20% utilisation as the base case
-        base_utilisation = 20.0  # 20% utilisation rate
-        actual_rental_days = results['total_available_days'] * (base_utilisation / 100.0)
-        actual_annual_revenue = results['weighted_avg_revenue'] * actual_rental_days
-        
-        # VAT on Revenue (assuming all revenue is VATable)
-        total_revenue_vat = actual_annual_revenue * vat_rate
-        
-        # VAT-deductible items (business expenses) - these are annual costs
-        vat_deductible_items = {
-            'DJI Flips': flip_qty * flip_cost * vat_rate,
-            'DJI Mini 4 Pros': mini4_qty * mini4_cost * vat_rate,
-            'Hard Cases': total_hard_cases_cost * vat_rate,
-            'SD Cards': (flip_qty + mini4_qty) * 38.99 * vat_rate,
-            'Extra Batteries': battery_cost * vat_rate,
-            'ND Filters': filter_cost * vat_rate,
-            'Website Setup': web_cost * vat_rate,
-            'Legal Fees': legal_cost * vat_rate,
-            'E-commerce Platform': platform_cost * vat_rate,
-            'Domain & Hosting': domain_cost * vat_rate,
-            'Corporate Insurance': insurance_cost * vat_rate,
-            'CAA Renewal': caa_cost * vat_rate,
-            'Digital Marketing': marketing_cost * vat_rate,
-            'Repairs & Maintenance': repairs_cost * vat_rate,
-            'Shipping Supplies': shipping_cost * vat_rate,
-            'Cardboard Boxes': box_cost * vat_rate,
-            'Accountant Costs': accountant_cost * 12 * vat_rate  # Annual accountant costs
-        }
-        
-        # Additional costs VAT
-        additional_costs_vat = sum(cost["amount"] * vat_rate for cost in st.session_state.get('additional_costs', []))
-        
-        total_vat_deductible = sum(vat_deductible_items.values()) + additional_costs_vat
-        
-        # Net VAT payable (VAT on revenue - VAT deductible)
-        net_vat_payable = total_revenue_vat - total_vat_deductible
-        
-        # Calculate actual profit based on utilisation
-        actual_annual_profit = actual_annual_revenue - (results['variable_cost_per_rental'] * actual_rental_days) - results['opex'] - results['capex']
-        profit_after_vat = actual_annual_profit - net_vat_payable
-        
-        # VAT registration threshold analysis
-        vat_threshold = 85000  # UK VAT registration threshold
-        months_to_threshold = (vat_threshold / actual_annual_revenue * 12) if actual_annual_revenue > 0 else float('inf')
-        
-        return {
-            'vat_rate': vat_rate,
-            'total_revenue_vat': total_revenue_vat,
-            'vat_deductible_items': vat_deductible_items,
-            'total_vat_deductible': total_vat_deductible,
-            'net_vat_payable': net_vat_payable,
-            'profit_before_vat': actual_annual_profit,
-            'profit_after_vat': profit_after_vat,
-            'vat_threshold': vat_threshold,
-            'annual_revenue': actual_annual_revenue,
-            'months_to_threshold': months_to_threshold,
-            'additional_costs_vat': additional_costs_vat,
-            'actual_rental_days': actual_rental_days,
-            'base_utilisation': base_utilisation
-        }
+    # Collect the widget values so the cached calculations key on explicit inputs
+    inputs = {
+        'flip_qty': flip_qty,
+        'flip_cost': flip_cost,
+        'mini4_qty': mini4_qty,
+        'mini4_cost': mini4_cost,
+        'case_cost_per_unit': case_cost_per_unit,
+        'battery_cost': battery_cost,
+        'filter_cost': filter_cost,
+        'web_cost': web_cost,
+        'legal_cost': legal_cost,
+        'platform_cost': platform_cost,
+        'domain_cost': domain_cost,
+        'insurance_cost': insurance_cost,
+        'caa_cost': caa_cost,
+        'marketing_cost': marketing_cost,
+        'repairs_cost': repairs_cost,
+        'shipping_cost': shipping_cost,
+        'box_cost': box_cost,
+        'processing_fee': processing_fee,
+        'accountant_cost': accountant_cost,
+        'flip_daily': flip_daily,
+        'flip_weekend': flip_weekend,
+        'flip_weekly': flip_weekly,
+        'mini4_daily': mini4_daily,
+        'mini4_weekend': mini4_weekend,
+        'mini4_weekly': mini4_weekly,
+        'mix_daily': mix_daily,
+        'mix_weekend': mix_weekend,
+        'mix_weekly': mix_weekly
+    }
+    
+    results = calculate_financials(**inputs, additional_costs_total=st.session_state.additional_costs_total)
+    
+    # Additional costs are passed as a tuple of (amount, note) pairs so the cache keys are cheap to hash
+    additional_costs = tuple((cost["amount"], cost["note"]) for cost in st.session_state.additional_costs)
     
-    vat_analysis = calculate_vat_analysis(results)
+    vat_analysis = calculate_vat_analysis(results, inputs, additional_costs)
     
     # Download section
     st.markdown("---")
@@ -1082,55 +1416,23 @@ if mix_total == 100.0:
     st.markdown("Export all pricing, inputs, and financial projections for analysis")
     
     # Create export data
-    export_data = create_export_data(results)
+    export_data = create_export_data(results, inputs, additional_costs)
     
     st.markdown("---")
     st.markdown("### 📊 Data Export Options")
     st.markdown("Export specific data sections for further analysis")
     
-    # Create a comprehensive CSV with all data
-    def create_comprehensive_csv():
-        output = io.StringIO()
-        
-        # Write header
-        output.write("AERORENT UK - FINANCIAL CALCULATOR EXPORT\n")
-        output.write(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n")
-        output.write("=" * 50 + "\n\n")
-        
-        # Write inputs
-        output.write("INPUT PARAMETERS\n")
-        output.write("-" * 20 + "\n")
-        export_data['inputs'].to_csv(output, index=False)
-        output.write("\n\n")
-        
-        # Write key metrics
-        output.write("KEY METRICS\n")
-        output.write("-" * 12 + "\n")
-        export_data['metrics'].to_csv(output, index=False)
-        output.write("\n\n")
-        
-        # Write projections
-        output.write("ANNUAL PROJECTIONS\n")
-        output.write("-" * 18 + "\n")
-        export_data['projections'].to_csv(output, index=False)
-        output.write("\n\n")
-        
-        # Write cost breakdown
-        output.write("COST BREAKDOWN\n")
-        output.write("-" * 14 + "\n")
-        export_data['cost_breakdown'].to_csv(output, index=False)
-        
-        return output.getvalue()
+    section_csvs = create_section_csvs(export_data)
+    csv_data = create_comprehensive_csv(section_csvs, datetime.now().strftime('%B %d, %Y at %I:%M %p'))
     
-    csv_data = create_comprehensive_csv()
-    
-    # Download button
+    # Downloads are served from the precomputed bytes and don't need to rerun the script
     st.download_button(
         label="📊 Download Complete Financial Report (CSV)",
         data=csv_data,
         file_name=f"aerorent_financial_report_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
         mime="text/csv",
-        help="Download all pricing, inputs, and financial projections as a comprehensive CSV file"
+        help="Download all pricing, inputs, and financial projections as a comprehensive CSV file",
+        on_click="ignore"
     )
     
     # Individual section downloads
@@ -1139,31 +1441,35 @@ if mix_total == 100.0:
     with download_col1:
         st.download_button(
             label="📋 Download Input Parameters",
-            data=export_data['inputs'].to_csv(index=False),
+            data=section_csvs['inputs'],
             file_name=f"aerorent_inputs_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
         
         st.download_button(
             label="📈 Download Projections",
-            data=export_data['projections'].to_csv(index=False),
+            data=section_csvs['projections'],
             file_name=f"aerorent_projections_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
     
     with download_col2:
         st.download_button(
             label="🎯 Download Key Metrics",
-            data=export_data['metrics'].to_csv(index=False),
+            data=section_csvs['metrics'],
             file_name=f"aerorent_metrics_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
         
         st.download_button(
             label="💰 Download Cost Breakdown",
-            data=export_data['cost_breakdown'].to_csv(index=False),
+            data=section_csvs['cost_breakdown'],
             file_name=f"aerorent_costs_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-            mime="text/csv"
+            mime="text/csv",
+            on_click="ignore"
         )
     
     st.markdown('</div>', unsafe_allow_html=True)
@@ -1171,204 +1477,119 @@ if mix_total == 100.0:
     # Key Metrics Section
     st.subheader("5. Key Metrics")
     
+    # Every card in the grid is bordered; the break-even figures are highlighted with bold labels
     # First row of metrics (3 boxes)
     metric_col1, metric_col2, metric_col3 = st.columns(3)
     
     with metric_col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>Total First-Year Costs</h4>
-            <h2>£{results['total_first_year_costs']:,.2f}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Total First-Year Costs", f"£{results['total_first_year_costs']:,.2f}", border=True)
     
     with metric_col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>Avg. Revenue per Day</h4>
-            <h2>£{results['weighted_avg_revenue']:.2f}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Avg. Revenue per Day", f"£{results['weighted_avg_revenue']:.2f}", border=True)
     
     with metric_col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>Contribution Margin</h4>
-            <h2>£{results['contribution_margin']:.2f}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Contribution Margin", f"£{results['contribution_margin']:.2f}", border=True)
     
-    # Second row of metrics (3 boxes)
+    # Second row of metrics (3 boxes), with the break-even figures highlighted
     metric_col4, metric_col5, metric_col6 = st.columns(3)
     
     with metric_col4:
-        st.markdown(f"""
-        <div class="metric-card break-even-highlight">
-            <h4>Break-Even Days</h4>
-            <h2>{results['break_even_days']:.0f}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("**Break-Even Days**", f"{results['break_even_days']:.0f}", border=True)
     
     with metric_col5:
-        st.markdown(f"""
-        <div class="metric-card break-even-highlight">
-            <h4>Break-Even Utilisation</h4>
-            <h2>{results['break_even_utilisation']:.1f}%</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("**Break-Even Utilisation**", f"{results['break_even_utilisation']:.1f}%", border=True)
     
     with metric_col6:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>Total Available Days</h4>
-            <h2>{results['total_available_days']:,.0f}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Total Available Days", f"{results['total_available_days']:,.0f}", border=True)
     
     # Third row - VAT-adjusted metrics
     metric_col7, metric_col8, metric_col9 = st.columns(3)
     
+    base_utilisation_note = f"Annual at {vat_analysis['base_utilisation']:.0f}% utilisation"
+    
     with metric_col7:
-        st.markdown(f"""
-        <div class="metric-card" style="border-left-color: #dc2626;">
-            <h4>Profit After VAT</h4>
-            <h2>£{vat_analysis['profit_after_vat']:,.0f}</h2>
-            <p style="font-size: 0.8rem; color: #6b7280;">Annual at {vat_analysis['base_utilisation']:.0f}% utilisation</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Profit After VAT", f"£{vat_analysis['profit_after_vat']:,.0f}", help=base_utilisation_note, border=True)
     
     with metric_col8:
-        st.markdown(f"""
-        <div class="metric-card" style="border-left-color: #dc2626;">
-            <h4>Net VAT Payable</h4>
-            <h2>£{vat_analysis['net_vat_payable']:,.0f}</h2>
-            <p style="font-size: 0.8rem; color: #6b7280;">Annual at {vat_analysis['base_utilisation']:.0f}% utilisation</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Net VAT Payable", f"£{vat_analysis['net_vat_payable']:,.0f}", help=base_utilisation_note, border=True)
     
     with metric_col9:
         vat_status = "Must Register" if vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold'] else "Below Threshold"
-        vat_color = "#dc2626" if vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold'] else "#059669"
-        st.markdown(f"""
-        <div class="metric-card" style="border-left-color: {vat_color};">
-            <h4>VAT Status</h4>
-            <h2 style="color: {vat_color};">{vat_status}</h2>
-            <p style="font-size: 0.8rem; color: #6b7280;">£{vat_analysis['annual_revenue']:,.0f} annual revenue</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("VAT Status", vat_status, help=f"£{vat_analysis['annual_revenue']:,.0f} annual revenue", border=True)
 
     # Projections table
     st.subheader("6. Annual Projections")
     
-    def calculate_projection(utilisation):
-        rental_days = results['total_available_days'] * (utilisation / 100.0)
-        total_revenue = rental_days * results['weighted_avg_revenue']
-        total_variable_costs = rental_days * results['variable_cost_per_rental']
-        profit = total_revenue - results['opex'] - total_variable_costs - results['capex']
-        return {'revenue': total_revenue, 'profit': profit}
-    
-    projections_data = []
-    utilisation_rates = [20, results['break_even_utilisation'], 30, 40]
-    
-    for util in utilisation_rates:
-        if util > 0:
-            proj = calculate_projection(util)
-            projections_data.append({
-                'Utilisation': f"{util:.1f}%",
-                'Annual Revenue': f"£{proj['revenue']:,.0f}",
-                'Annual Profit': f"£{proj['profit']:,.0f}",
-                'Profit_Margin': proj['profit']
-            })
-    
-    df_projections = pd.DataFrame(projections_data)
-    
-    # Style the dataframe
-    def color_profit(val):
-        try:
-            profit = float(val.replace('£', '').replace(',', ''))
-            return 'color: #059669' if profit >= 0 else 'color: #dc2626'
-        except:
-            return ''
-    
-    styled_df = df_projections.style.applymap(color_profit, subset=['Annual Profit'])
-    st.dataframe(styled_df, use_container_width=True)
+    utilisation_rates = np.array([20, results['break_even_utilisation'], 30, 40], dtype=np.float64)
+    utilisation_rates = utilisation_rates[utilisation_rates > 0]
+    proj = calculate_projection(results, utilisation_rates)
+    
+    df_projections = pd.DataFrame({
+        'Utilisation': utilisation_rates,
+        'Annual Revenue': proj['revenue'],
+        'Annual Profit': proj['profit']
+    })
+    
+    # Ship raw numbers and let the client format them rather than rendering a Styler to HTML
+    pounds_column = st.column_config.NumberColumn(format="£%,.0f")
+    st.dataframe(df_projections, column_config={
+        'Utilisation': st.column_config.NumberColumn(format="%.1f%%"),
+        'Annual Revenue': pounds_column,
+        'Annual Profit': pounds_column
+    }, use_container_width=True)
     
     # Monthly Revenue Projections Section
     st.subheader("7. Monthly Revenue & Rental Projections")
     
-    def calculate_monthly_projection(utilisation):
-        rental_days = results['total_available_days'] * (utilisation / 100.0)
-        total_revenue = rental_days * results['weighted_avg_revenue']
-        total_variable_costs = rental_days * results['variable_cost_per_rental']
-        
-        # Calculate monthly values
-        monthly_revenue = total_revenue / 12.0
-        monthly_variable_costs = total_variable_costs / 12.0
-        monthly_operational_costs = results['opex'] / 12.0
-        
-        # Monthly profit EXCLUDES capital expenditure (one-time cost)
-        monthly_profit = monthly_revenue - monthly_variable_costs - monthly_operational_costs
-        monthly_rental_days = rental_days / 12.0
-        
-        # Calculate actual rentals per month (assuming average rental duration)
-        # Based on rental mix: 20% daily, 60% weekend, 20% weekly
-        avg_rental_duration = (0.2 * 1) + (0.6 * 2) + (0.2 * 7)  # weighted average days per rental
-        monthly_rentals = monthly_rental_days / avg_rental_duration if avg_rental_duration > 0 else 0
-        
-        return {
-            'monthly_revenue': monthly_revenue,
-            'monthly_profit': monthly_profit,
-            'monthly_rental_days': monthly_rental_days,
-            'monthly_rentals': monthly_rentals,
-            'monthly_variable_costs': monthly_variable_costs,
-            'monthly_operational_costs': monthly_operational_costs,
-            'annual_revenue': total_revenue,
-            'annual_profit': monthly_profit * 12,  # Annual profit excluding capex
-            'avg_rental_duration': avg_rental_duration
-        }
-    
     # Calculate projections for specified utilisation rates
-    monthly_projections_data = []
-    target_utilisation_rates = [15, 20, 30]
-    
-    for util in target_utilisation_rates:
-        proj = calculate_monthly_projection(util)
-        monthly_projections_data.append({
-            'Utilisation Rate': f"{util}%",
-            'Monthly Rentals': f"{proj['monthly_rentals']:.1f}",
-            'Avg Rental Duration': f"{proj['avg_rental_duration']:.1f} days",
-            'Monthly Revenue': f"£{proj['monthly_revenue']:,.0f}",
-            'Monthly Profit': f"£{proj['monthly_profit']:,.0f}",
-            'Annual Revenue': f"£{proj['annual_revenue']:,.0f}",
-            'Annual Profit': f"£{proj['annual_profit']:,.0f}",
-            'Profit_Margin': proj['monthly_profit']
-        })
-    
-    df_monthly_projections = pd.DataFrame(monthly_projections_data)
-    
-    # Style the monthly projections dataframe
-    styled_monthly_df = df_monthly_projections.style.applymap(color_profit, subset=['Monthly Profit'])
-    st.dataframe(styled_monthly_df, use_container_width=True)
+    target_utilisation_rates = np.array([15, 20, 30])
+    monthly = calculate_monthly_projections(results, target_utilisation_rates)
+    
+    df_monthly_projections = pd.DataFrame({
+        'Utilisation Rate': target_utilisation_rates,
+        'Monthly Rentals': monthly['monthly_rentals'],
+        'Avg Rental Duration': monthly['avg_rental_duration'],
+        'Monthly Revenue': monthly['monthly_revenue'],
+        'Monthly Profit': monthly['monthly_profit'],
+        'Annual Revenue': monthly['annual_revenue'],
+        'Annual Profit': monthly['annual_profit']
+    })
+    utilisation_column = st.column_config.NumberColumn(format="%d%%")
+    rentals_column = st.column_config.NumberColumn(format="%.1f")
+    st.dataframe(df_monthly_projections, column_config={
+        'Utilisation Rate': utilisation_column,
+        'Monthly Rentals': rentals_column,
+        'Avg Rental Duration': st.column_config.NumberColumn(format="%.1f days"),
+        'Monthly Revenue': pounds_column,
+        'Monthly Profit': pounds_column,
+        'Annual Revenue': pounds_column,
+        'Annual Profit': pounds_column
+    }, use_container_width=True)
     
     # Monthly Cost Breakdown
     st.markdown("**📊 Monthly Cost Breakdown:**")
     
-    cost_breakdown_data = []
-    for util in target_utilisation_rates:
-        proj = calculate_monthly_projection(util)
-        cost_breakdown_data.append({
-            'Utilisation Rate': f"{util}%",
-            'Monthly Rentals': f"{proj['monthly_rentals']:.1f}",
-            'Monthly Revenue': f"£{proj['monthly_revenue']:,.2f}",
-            'Variable Costs': f"£{proj['monthly_variable_costs']:,.2f}",
-            'Fixed Operational Costs': f"£{proj['monthly_operational_costs']:,.2f}",
-            'Total Monthly Costs': f"£{proj['monthly_variable_costs'] + proj['monthly_operational_costs']:,.2f}",
-            'Monthly Profit': f"£{proj['monthly_profit']:,.2f}",
-            'Profit Margin %': f"{(proj['monthly_profit'] / proj['monthly_revenue'] * 100):.1f}%" if proj['monthly_revenue'] > 0 else "0.0%"
-        })
-    
-    df_cost_breakdown = pd.DataFrame(cost_breakdown_data)
-    st.dataframe(df_cost_breakdown, use_container_width=True)
+    df_cost_breakdown = pd.DataFrame({
+        'Utilisation Rate': target_utilisation_rates,
+        'Monthly Rentals': monthly['monthly_rentals'],
+        'Monthly Revenue': monthly['monthly_revenue'],
+        'Variable Costs': monthly['monthly_variable_costs'],
+        'Fixed Operational Costs': monthly['monthly_operational_costs'],
+        'Total Monthly Costs': monthly['monthly_variable_costs'] + monthly['monthly_operational_costs'],
+        'Monthly Profit': monthly['monthly_profit'],
+        'Profit Margin %': monthly['monthly_margin']
+    })
+    pence_column = st.column_config.NumberColumn(format="£%,.2f")
+    st.dataframe(df_cost_breakdown, column_config={
+        'Utilisation Rate': utilisation_column,
+        'Monthly Rentals': rentals_column,
+        'Monthly Revenue': pence_column,
+        'Variable Costs': pence_column,
+        'Fixed Operational Costs': pence_column,
+        'Total Monthly Costs': pence_column,
+        'Monthly Profit': pence_column,
+        'Profit Margin %': st.column_config.NumberColumn(format="%.1f%%")
+    }, use_container_width=True)
     
     # Add explanatory text
     st.markdown("""
@@ -1395,10 +1616,11 @@ if mix_total == 100.0:
     # Calculate costs
     capex = results['capex']
     opex = results['opex']
-    additional_costs = sum(cost["amount"] for cost in st.session_state.get('additional_costs', []))
+    # Running total kept by the additional-costs editor, so the list isn't summed again here
+    additional_costs_total = st.session_state.additional_costs_total
     
     # Initial Expenditure (One-time costs)
-    initial_expenditure = capex + additional_costs
+    initial_expenditure = capex + additional_costs_total
     
     # Monthly costs (Annual operational costs / 12)
     monthly_costs = opex / 12.0
@@ -1407,40 +1629,36 @@ if mix_total == 100.0:
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>Initial Expenditure</h4>
-            <h3>£{initial_expenditure:,.2f}</h3>
-            <p style="font-size: 0.8rem; color: #6b7280;">One-time startup costs</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Initial Expenditure", f"£{initial_expenditure:,.2f}", help="One-time startup costs", border=True)
     
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>Monthly Fixed Costs</h4>
-            <h3>£{monthly_costs:,.2f}</h3>
-            <p style="font-size: 0.8rem; color: #6b7280;">£{annual_monthly_costs:,.2f} annually</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Monthly Fixed Costs", f"£{monthly_costs:,.2f}", help=f"£{annual_monthly_costs:,.2f} annually", border=True)
     
     # Detailed breakdown
     col1, col2 = st.columns(2)
     
+    # Each column is sent as one markdown element rather than one per line
+    website_legal_cost = web_cost + legal_cost
+    initial_lines = [
+        "**Initial Expenditure Details:**",
+        f"- Drones & Equipment: £{capex - website_legal_cost:,.2f}",
+        f"- Website & Legal: £{website_legal_cost:,.2f}"
+    ]
+    if additional_costs_total > 0:
+        initial_lines.append(f"- Additional Costs: £{additional_costs_total:,.2f}")
+    
     with col1:
-        st.markdown("**Initial Expenditure Details:**")
-        st.markdown(f"- Drones & Equipment: £{capex - web_cost - legal_cost:,.2f}")
-        st.markdown(f"- Website & Legal: £{web_cost + legal_cost:,.2f}")
-        if additional_costs > 0:
-            st.markdown(f"- Additional Costs: £{additional_costs:,.2f}")
+        st.markdown("\n".join(initial_lines))
     
     with col2:
-        st.markdown("**Monthly Fixed Operational Costs:**")
-        st.markdown(f"- Platform & Hosting: £{(platform_cost + domain_cost) / 12:,.2f}")
-        st.markdown(f"- Insurance & CAA: £{(insurance_cost + caa_cost) / 12:,.2f}")
-        st.markdown(f"- Marketing: £{marketing_cost / 12:,.2f}")
-        st.markdown(f"- Repairs & Maintenance: £{repairs_cost / 12:,.2f}")
-        st.markdown(f"- Accountant: £{accountant_cost:,.2f}")
+        st.markdown("\n".join([
+            "**Monthly Fixed Operational Costs:**",
+            f"- Platform & Hosting: £{(platform_cost + domain_cost) / 12:,.2f}",
+            f"- Insurance & CAA: £{(insurance_cost + caa_cost) / 12:,.2f}",
+            f"- Marketing: £{marketing_cost / 12:,.2f}",
+            f"- Repairs & Maintenance: £{repairs_cost / 12:,.2f}",
+            f"- Accountant: £{accountant_cost:,.2f}"
+        ]))
     
     # Variable vs Fixed Cost Explanation
     st.markdown("""
@@ -1471,217 +1689,36 @@ if mix_total == 100.0:
     
     with chart_col1:
         # Revenue vs Utilisation chart
-        utilisation_range = list(range(10, 51, 5))
-        revenue_data = []
-        profit_data = []
-        
-        for util in utilisation_range:
-            proj = calculate_projection(util)
-            revenue_data.append(proj['revenue'])
-            profit_data.append(proj['profit'])
-        
-        fig_revenue = go.Figure()
-        fig_revenue.add_trace(go.Scatter(
-            x=utilisation_range,
-            y=revenue_data,
-            mode='lines+markers',
-            name='Annual Revenue',
-            line=dict(color='#4f46e5', width=3)
-        ))
-        fig_revenue.add_trace(go.Scatter(
-            x=utilisation_range,
-            y=profit_data,
-            mode='lines+markers',
-            name='Annual Profit',
-            line=dict(color='#059669', width=3)
-        ))
-        
-        fig_revenue.update_layout(
-            title='Revenue & Profit vs Utilisation Rate',
-            xaxis_title='Utilisation Rate (%)',
-            yaxis_title='Amount (£)',
-            hovermode='x unified',
-            height=400
+        fig_revenue = build_revenue_fig(
+            results['total_available_days'], results['weighted_avg_revenue'],
+            results['variable_cost_per_rental'], results['opex'], results['capex']
         )
         
-        st.plotly_chart(fig_revenue, use_container_width=True)
+        # Stable keys keep each chart element's identity across reruns, so the frontend updates it in place
+        st.plotly_chart(fig_revenue, use_container_width=True, key="revenue_chart")
     
     with chart_col2:
         # Cost breakdown pie chart
-        cost_data = {
-            'DJI Flips': flip_qty * flip_cost,
-            'DJI Mini 4 Pros': mini4_qty * mini4_cost,
-            'Hard Cases': total_hard_cases_cost,
-            'SD Cards': (flip_qty + mini4_qty) * 38.99,
-            'Batteries & Filters': battery_cost + filter_cost,
-            'Website & Legal': web_cost + legal_cost,
-            'Annual Opex': results['opex']
-        }
-        
-        fig_costs = px.pie(
-            values=list(cost_data.values()),
-            names=list(cost_data.keys()),
-            title='Cost Breakdown',
-            color_discrete_sequence=px.colors.qualitative.Set3
+        fig_costs = build_cost_pie(
+            flip_qty * flip_cost,
+            mini4_qty * mini4_cost,
+            total_hard_cases_cost,
+            (flip_qty + mini4_qty) * SD_CARD_UNIT_COST,
+            battery_cost + filter_cost,
+            web_cost + legal_cost,
+            results['opex']
         )
-        fig_costs.update_layout(height=400)
         
-        st.plotly_chart(fig_costs, use_container_width=True)
+        st.plotly_chart(fig_costs, use_container_width=True, key="cost_chart")
 
     # Business Planning Metrics
     st.subheader("10. Business Planning & Investment Metrics")
     
     # Calculate additional financial metrics
-    def calculate_business_metrics(results, utilisation_rates=None):
-        # If no utilisation rates provided, use default ones including break-even
-        if utilisation_rates is None:
-            # Get break-even utilisation and ensure it's included in the analysis
-            break_even_util = results['break_even_utilisation']
-            base_rates = [15, 20, 30]
-            
-            # Add break-even utilisation if it's not already in the base rates
-            # Round to nearest 5% for cleaner display
-            rounded_break_even = round(break_even_util / 5) * 5
-            if rounded_break_even not in base_rates and 10 <= rounded_break_even <= 50:
-                utilisation_rates = sorted(base_rates + [rounded_break_even])
-            else:
-                utilisation_rates = base_rates
-        """
-        Calculate business planning metrics with two different approaches:
-        1. ROI & Payback: Include capex to measure return on total investment
-        2. Cash Flow: Exclude capex to measure ongoing operational cash generation
-        """
-        metrics = {}
-        
-        # ROI and Payback Period calculations
-        initial_investment = results['total_first_year_costs']
-        
-        # Calculate ROI for different utilisation rates
-        roi_data = []
-        payback_data = []
-        cash_flow_data = []
-        
-        for util in utilisation_rates:
-            proj = calculate_projection(util)
-            annual_profit = proj['profit']  # Includes capex for ROI/payback calculations
-            
-            # ROI = (Annual Profit / Initial Investment) * 100
-            # Note: Annual profit includes capex to measure return on total investment
-            roi = (annual_profit / initial_investment * 100) if initial_investment > 0 else 0
-            
-            # Payback Period = Initial Investment / Annual Profit
-            # Note: Annual profit includes capex to measure time to recover total investment
-            payback_years = initial_investment / annual_profit if annual_profit > 0 else float('inf')
-            payback_months = payback_years * 12 if payback_years != float('inf') else float('inf')
-            
-            # Cash Flow Analysis
-            # Use the same logic as calculate_monthly_projection - exclude capex from monthly calculations
-            # Note: Cash flow excludes capex to measure ongoing operational cash generation
-            rental_days = results['total_available_days'] * (util / 100.0)
-            total_revenue = rental_days * results['weighted_avg_revenue']
-            total_variable_costs = rental_days * results['variable_cost_per_rental']
-            
-            # Calculate monthly values (excluding capex)
-            monthly_revenue = total_revenue / 12.0
-            monthly_variable_costs = total_variable_costs / 12.0
-            monthly_operational_costs = results['opex'] / 12.0
-            monthly_profit = monthly_revenue - monthly_variable_costs - monthly_operational_costs
-            
-            # Monthly cash flow is the same as monthly profit (excluding capex)
-            monthly_cash_flow = monthly_profit
-            
-            roi_data.append({
-                'Utilisation': f"{util}%",
-                'ROI': roi,
-                'Annual Profit': annual_profit,
-                'Initial Investment': initial_investment
-            })
-            
-            payback_data.append({
-                'Utilisation': f"{util}%",
-                'Payback Years': payback_years,
-                'Payback Months': payback_months,
-                'Annual Profit': annual_profit
-            })
-            
-            cash_flow_data.append({
-                'Utilisation': f"{util}%",
-                'Monthly Cash Flow': monthly_cash_flow,
-                'Annual Cash Flow': monthly_cash_flow * 12,
-                'Monthly Profit': monthly_profit
-            })
-        
-        metrics['roi_data'] = roi_data
-        metrics['payback_data'] = payback_data
-        metrics['cash_flow_data'] = cash_flow_data
-        
-        # Sensitivity Analysis
-        sensitivity_data = []
-        base_utilisation = 20  # Base case
-        base_proj = calculate_projection(base_utilisation)
-        base_profit = base_proj['profit']
-        
-        # Test different scenarios
-        scenarios = [
-            ('Revenue -10%', 0.9, 1.0),
-            ('Revenue -5%', 0.95, 1.0),
-            ('Base Case', 1.0, 1.0),
-            ('Revenue +5%', 1.05, 1.0),
-            ('Revenue +10%', 1.10, 1.0),
-            ('Costs +10%', 1.0, 1.1),
-            ('Costs +5%', 1.0, 1.05),
-            ('Costs -5%', 1.0, 0.95),
-            ('Costs -10%', 1.0, 0.9)
-        ]
-        
-        for scenario_name, revenue_mult, cost_mult in scenarios:
-            if 'Revenue' in scenario_name:  # Revenue scenarios
-                adjusted_revenue = base_proj['revenue'] * revenue_mult
-                adjusted_variable_costs = (base_proj['revenue'] - base_profit - results['opex']) * revenue_mult
-                adjusted_profit = adjusted_revenue - results['opex'] - adjusted_variable_costs - results['capex']
-            else:  # Cost scenarios
-                adjusted_profit = base_profit - (results['opex'] * (cost_mult - 1))
-            
-            profit_change = ((adjusted_profit - base_profit) / base_profit * 100) if base_profit != 0 else 0
-            sensitivity_data.append({
-                'Scenario': scenario_name,
-                'Adjusted Profit': adjusted_profit,
-                'Profit Change %': profit_change
-            })
-        
-        metrics['sensitivity_data'] = sensitivity_data
-        
-        # Risk Assessment
-        worst_case = calculate_projection(10)  # 10% utilisation
-        best_case = calculate_projection(40)   # 40% utilisation
-        expected_case = calculate_projection(20)  # 20% utilisation
-        
-        risk_metrics = {
-            'Worst Case (10% Utilisation)': {
-                'Annual Profit': worst_case['profit'],
-                'ROI': (worst_case['profit'] / initial_investment * 100) if initial_investment > 0 else 0,
-                'Payback Years': initial_investment / worst_case['profit'] if worst_case['profit'] > 0 else float('inf')
-            },
-            'Expected Case (20% Utilisation)': {
-                'Annual Profit': expected_case['profit'],
-                'ROI': (expected_case['profit'] / initial_investment * 100) if initial_investment > 0 else 0,
-                'Payback Years': initial_investment / expected_case['profit'] if expected_case['profit'] > 0 else float('inf')
-            },
-            'Best Case (40% Utilisation)': {
-                'Annual Profit': best_case['profit'],
-                'ROI': (best_case['profit'] / initial_investment * 100) if initial_investment > 0 else 0,
-                'Payback Years': initial_investment / best_case['profit'] if best_case['profit'] > 0 else float('inf')
-            }
-        }
-        
-        metrics['risk_metrics'] = risk_metrics
-        
-        return metrics
-    
     business_metrics = calculate_business_metrics(results, utilisation_rates=None)
     
     # Debug: Show what utilisation rates are being used
-    st.write("Debug - Utilisation rates in analysis:", [data['Utilisation'] for data in business_metrics['roi_data']])
+    st.write("Debug - Utilisation rates in analysis:", business_metrics['roi_data']['Utilisation'])
     
     # Generate PDF Report
     st.markdown("### 📄 Professional Business Plan PDF")
@@ -1692,19 +1729,22 @@ if mix_total == 100.0:
             try:
                 # Use custom report name if provided, otherwise use preset name
                 report_name = custom_report_name.strip() if custom_report_name.strip() else selected_preset
-                pdf_data = generate_pdf_report(results, vat_analysis, business_metrics, export_data, report_name)
+                generated_at = datetime.now()
+                pdf_data = generate_pdf_report(results, inputs, vat_analysis, business_metrics, report_name,
+                                               generated_at.strftime('%B %d, %Y'))
                 
                 # Create filename with custom name
                 safe_name = "".join(c for c in report_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
                 safe_name = safe_name.replace(' ', '_')
-                filename = f"aerorent_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+                filename = f"aerorent_{safe_name}_{generated_at.strftime('%Y%m%d_%H%M')}.pdf"
                 
                 st.download_button(
                     label="📄 Download Business Plan PDF",
                     data=pdf_data,
                     file_name=filename,
                     mime="application/pdf",
-                    help="Download the complete business plan as a professional PDF document"
+                    help="Download the complete business plan as a professional PDF document",
+                    on_click="ignore"
                 )
                 
                 st.success("✅ Business plan PDF generated successfully! Click the download button above to save.")
@@ -1726,110 +1766,68 @@ if mix_total == 100.0:
         with col1:
             st.markdown("**ROI Analysis**")
             roi_df = pd.DataFrame(business_metrics['roi_data'])
-            roi_df['ROI'] = roi_df['ROI'].round(1)
-            roi_df['Annual Profit'] = roi_df['Annual Profit'].apply(lambda x: f"£{x:,.0f}")
-            roi_df['Initial Investment'] = roi_df['Initial Investment'].apply(lambda x: f"£{x:,.0f}")
-            st.dataframe(roi_df, use_container_width=True)
+            st.dataframe(roi_df, column_config={
+                'ROI': st.column_config.NumberColumn(format="%.1f"),
+                'Annual Profit': pounds_column,
+                'Initial Investment': pounds_column
+            }, use_container_width=True)
         
         with col2:
             st.markdown("**Payback Period Analysis**")
             payback_df = pd.DataFrame(business_metrics['payback_data'])
             payback_df['Payback Years'] = payback_df['Payback Years'].apply(lambda x: f"{x:.1f}" if x != float('inf') and x < 1000 else "∞")
             payback_df['Payback Months'] = payback_df['Payback Months'].apply(lambda x: f"{x:.0f}" if x != float('inf') and x < 12000 else "∞")
-            payback_df['Annual Profit'] = payback_df['Annual Profit'].apply(lambda x: f"£{x:,.0f}")
-            st.dataframe(payback_df, use_container_width=True)
+            # Payback keeps text cells so unreachable paybacks can show ∞; the profit stays numeric
+            st.dataframe(payback_df, column_config={
+                'Annual Profit': pounds_column
+            }, use_container_width=True)
         
         # ROI Chart
-        roi_values = [data['ROI'] for data in business_metrics['roi_data']]
-        utilisation_labels = [data['Utilisation'] for data in business_metrics['roi_data']]
-        
-        fig_roi = go.Figure()
-        fig_roi.add_trace(go.Bar(
-            x=utilisation_labels,
-            y=roi_values,
-            marker_color=['#4f46e5' if roi > 0 else '#dc2626' for roi in roi_values],
-            text=[f"{roi:.1f}%" for roi in roi_values],
-            textposition='auto'
-        ))
-        
-        fig_roi.update_layout(
-            title='Return on Investment by Utilisation Rate',
-            xaxis_title='Utilisation Rate',
-            yaxis_title='ROI (%)',
-            height=400,
-            xaxis=dict(
-                type='category',
-                categoryorder='array',
-                categoryarray=utilisation_labels
-            )
-        )
+        roi_values = business_metrics['roi_data']['ROI']
+        utilisation_labels = business_metrics['roi_data']['Utilisation']
         
-        st.plotly_chart(fig_roi, use_container_width=True)
+        st.vega_lite_chart(spec=signed_bar_spec(
+            utilisation_labels, roi_values, [f"{roi:.1f}%" for roi in roi_values], '#4f46e5',
+            'Return on Investment by Utilisation Rate', 'Utilisation Rate', 'ROI (%)'
+        ), use_container_width=True)
     
     with tab2:
         st.markdown("**Cash Flow Analysis**")
         
         cash_flow_df = pd.DataFrame(business_metrics['cash_flow_data'])
-        cash_flow_df['Monthly Cash Flow'] = cash_flow_df['Monthly Cash Flow'].apply(lambda x: f"£{x:,.0f}")
-        cash_flow_df['Annual Cash Flow'] = cash_flow_df['Annual Cash Flow'].apply(lambda x: f"£{x:,.0f}")
-        cash_flow_df['Monthly Profit'] = cash_flow_df['Monthly Profit'].apply(lambda x: f"£{x:,.0f}")
-        
-        st.dataframe(cash_flow_df, use_container_width=True)
+        st.dataframe(cash_flow_df, column_config={
+            'Monthly Cash Flow': pounds_column,
+            'Annual Cash Flow': pounds_column,
+            'Monthly Profit': pounds_column
+        }, use_container_width=True)
         
         # Cash Flow Chart
-        monthly_cash_flows = [data['Monthly Cash Flow'] for data in business_metrics['cash_flow_data']]
-        utilisation_labels = [data['Utilisation'] for data in business_metrics['cash_flow_data']]
-        
-        fig_cashflow = go.Figure()
-        fig_cashflow.add_trace(go.Bar(
-            x=utilisation_labels,
-            y=monthly_cash_flows,
-            marker_color=['#059669' if cf > 0 else '#dc2626' for cf in monthly_cash_flows],
-            text=[f"£{cf:,.0f}" for cf in monthly_cash_flows],
-            textposition='auto'
-        ))
-        
-        fig_cashflow.update_layout(
-            title='Monthly Cash Flow by Utilisation Rate',
-            xaxis_title='Utilisation Rate',
-            yaxis_title='Monthly Cash Flow (£)',
-            height=400
-        )
+        monthly_cash_flows = business_metrics['cash_flow_data']['Monthly Cash Flow']
+        utilisation_labels = business_metrics['cash_flow_data']['Utilisation']
         
-        st.plotly_chart(fig_cashflow, use_container_width=True)
+        st.vega_lite_chart(spec=signed_bar_spec(
+            utilisation_labels, monthly_cash_flows, [f"£{cf:,.0f}" for cf in monthly_cash_flows], '#059669',
+            'Monthly Cash Flow by Utilisation Rate', 'Utilisation Rate', 'Monthly Cash Flow (£)'
+        ), use_container_width=True)
     
     with tab3:
         st.markdown("**Sensitivity Analysis**")
         st.markdown("How changes in revenue and costs affect profitability")
         
         sensitivity_df = pd.DataFrame(business_metrics['sensitivity_data'])
-        sensitivity_df['Adjusted Profit'] = sensitivity_df['Adjusted Profit'].apply(lambda x: f"£{x:,.0f}")
-        sensitivity_df['Profit Change %'] = sensitivity_df['Profit Change %'].apply(lambda x: f"{x:+.1f}%")
-        
-        st.dataframe(sensitivity_df, use_container_width=True)
+        st.dataframe(sensitivity_df, column_config={
+            'Adjusted Profit': pounds_column,
+            'Profit Change %': st.column_config.NumberColumn(format="%+.1f%%")
+        }, use_container_width=True)
         
         # Sensitivity Chart
-        scenarios = [data['Scenario'] for data in business_metrics['sensitivity_data']]
-        profit_changes = [data['Profit Change %'] for data in business_metrics['sensitivity_data']]
-        
-        fig_sensitivity = go.Figure()
-        fig_sensitivity.add_trace(go.Bar(
-            x=scenarios,
-            y=profit_changes,
-            marker_color=['#059669' if pc > 0 else '#dc2626' for pc in profit_changes],
-            text=[f"{pc:+.1f}%" for pc in profit_changes],
-            textposition='auto'
-        ))
-        
-        fig_sensitivity.update_layout(
-            title='Profit Sensitivity to Revenue and Cost Changes',
-            xaxis_title='Scenario',
-            yaxis_title='Profit Change (%)',
-            height=400,
-            xaxis_tickangle=-45
-        )
+        scenarios = business_metrics['sensitivity_data']['Scenario']
+        profit_changes = business_metrics['sensitivity_data']['Profit Change %']
         
-        st.plotly_chart(fig_sensitivity, use_container_width=True)
+        st.vega_lite_chart(spec=signed_bar_spec(
+            scenarios, profit_changes, [f"{pc:+.1f}%" for pc in profit_changes], '#059669',
+            'Profit Sensitivity to Revenue and Cost Changes', 'Scenario', 'Profit Change (%)', label_angle=-45
+        ), use_container_width=True)
     
     with tab4:
         st.markdown("**Risk Assessment - Scenario Analysis**")
@@ -1839,40 +1837,19 @@ if mix_total == 100.0:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown("**🔴 Worst Case (10% Utilisation)**")
             worst = risk_metrics['Worst Case (10% Utilisation)']
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Annual Profit</h4>
-                <h3>£{worst['Annual Profit']:,.0f}</h3>
-                <p>ROI: {worst['ROI']:.1f}%</p>
-                <p>Payback: {worst['Payback Years']:.1f} years</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(f"**🔴 Worst Case (10% Utilisation)**  \nROI: {worst['ROI']:.1f}% · Payback: {worst['Payback Years']:.1f} years")
+            st.metric("Annual Profit", f"£{worst['Annual Profit']:,.0f}", border=True)
         
         with col2:
-            st.markdown("**🟡 Expected Case (20% Utilisation)**")
             expected = risk_metrics['Expected Case (20% Utilisation)']
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Annual Profit</h4>
-                <h3>£{expected['Annual Profit']:,.0f}</h3>
-                <p>ROI: {expected['ROI']:.1f}%</p>
-                <p>Payback: {expected['Payback Years']:.1f} years</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(f"**🟡 Expected Case (20% Utilisation)**  \nROI: {expected['ROI']:.1f}% · Payback: {expected['Payback Years']:.1f} years")
+            st.metric("Annual Profit", f"£{expected['Annual Profit']:,.0f}", border=True)
         
         with col3:
-            st.markdown("**🟢 Best Case (40% Utilisation)**")
             best = risk_metrics['Best Case (40% Utilisation)']
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Annual Profit</h4>
-                <h3>£{best['Annual Profit']:,.0f}</h3>
-                <p>ROI: {best['ROI']:.1f}%</p>
-                <p>Payback: {best['Payback Years']:.1f} years</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(f"**🟢 Best Case (40% Utilisation)**  \nROI: {best['ROI']:.1f}% · Payback: {best['Payback Years']:.1f} years")
+            st.metric("Annual Profit", f"£{best['Annual Profit']:,.0f}", border=True)
         
         # Risk vs Reward Chart
         scenarios = ['Worst Case', 'Expected Case', 'Best Case']
@@ -1883,24 +1860,16 @@ if mix_total == 100.0:
                 risk_metrics['Expected Case (20% Utilisation)']['ROI'],
                 risk_metrics['Best Case (40% Utilisation)']['ROI']]
         
-        fig_risk = go.Figure()
-        fig_risk.add_trace(go.Scatter(
-            x=scenarios,
-            y=profits,
-            mode='lines+markers',
-            name='Annual Profit',
-            line=dict(color='#4f46e5', width=3),
-            marker=dict(size=10)
-        ))
-        
-        fig_risk.update_layout(
-            title='Risk vs Reward Analysis',
-            xaxis_title='Scenario',
-            yaxis_title='Annual Profit (£)',
-            height=400
-        )
-        
-        st.plotly_chart(fig_risk, use_container_width=True)
+        st.vega_lite_chart(spec={
+            'title': 'Risk vs Reward Analysis',
+            'height': 400,
+            'data': {'values': [{'scenario': scenario, 'profit': profit} for scenario, profit in zip(scenarios, profits)]},
+            'mark': {'type': 'line', 'color': '#4f46e5', 'strokeWidth': 3, 'point': {'size': 100, 'color': '#4f46e5'}},
+            'encoding': {
+                'x': {'field': 'scenario', 'type': 'nominal', 'title': 'Scenario', 'sort': None, 'axis': {'labelAngle': 0}},
+                'y': {'field': 'profit', 'type': 'quantitative', 'title': 'Annual Profit (£)'}
+            }
+        }, use_container_width=True)
     
     with tab5:
         st.markdown("**📊 Business Planning Summary**")
@@ -1908,38 +1877,20 @@ if mix_total == 100.0:
         # Key Investment Metrics
         st.markdown("**Key Investment Metrics:**")
         
-        expected_roi = business_metrics['roi_data'][1]['ROI']  # 20% utilisation
-        expected_payback = business_metrics['payback_data'][1]['Payback Years']
-        expected_cash_flow = business_metrics['cash_flow_data'][1]['Monthly Cash Flow']
+        expected_roi = business_metrics['roi_data']['ROI'][1]  # 20% utilisation
+        expected_payback = business_metrics['payback_data']['Payback Years'][1]
+        expected_cash_flow = business_metrics['cash_flow_data']['Monthly Cash Flow'][1]
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Expected ROI</h4>
-                <h2>{expected_roi:.1f}%</h2>
-                <p style="font-size: 0.8rem; color: #6b7280;">At 20% utilisation</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Expected ROI", f"{expected_roi:.1f}%", help="At 20% utilisation", border=True)
         
         with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Payback Period</h4>
-                <h2>{expected_payback:.1f} years</h2>
-                <p style="font-size: 0.8rem; color: #6b7280;">Time to recover investment</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Payback Period", f"{expected_payback:.1f} years", help="Time to recover investment", border=True)
         
         with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Monthly Cash Flow</h4>
-                <h2>£{expected_cash_flow:,.0f}</h2>
-                <p style="font-size: 0.8rem; color: #6b7280;">Net cash generation</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Monthly Cash Flow", f"£{expected_cash_flow:,.0f}", help="Net cash generation", border=True)
         
         # Business Planning Insights
         st.markdown("""
@@ -2009,96 +1960,36 @@ if mix_total == 100.0:
         </div>
         """, unsafe_allow_html=True)
 
-        # VAT Summary Metrics
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>VAT Rate</h4>
-                <h2>{vat_analysis['vat_rate'] * 100:.0f}%</h2>
-                <p style="font-size: 0.8rem; color: #6b7280;">Standard UK VAT rate</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Net VAT Payable</h4>
-                <h2>£{vat_analysis['net_vat_payable']:,.0f}</h2>
-                <p style="font-size: 0.8rem; color: #6b7280;">Per rental day</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Profit After VAT</h4>
-                <h2>£{vat_analysis['profit_after_vat']:,.0f}</h2>
-                <p style="font-size: 0.8rem; color: #6b7280;">Per rental day</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # VAT Registration Analysis
-        st.markdown("**📋 VAT Registration Analysis**")
+        # VAT Summary & Registration Analysis
+        # Both card rows share the same three-column layout, so lay them out in one set of columns
+        st.markdown("**📋 VAT Summary & Registration Analysis**")
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>Annual Revenue</h4>
-                <h3>£{vat_analysis['annual_revenue']:,.0f}</h3>
-                <p style="font-size: 0.8rem; color: #6b7280;">Total annual revenue</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("VAT Rate", f"{vat_analysis['vat_rate'] * 100:.0f}%", help="Standard UK VAT rate", border=True)
+            st.metric("Annual Revenue", f"£{vat_analysis['annual_revenue']:,.0f}", help="Total annual revenue", border=True)
         
         with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <h4>VAT Threshold</h4>
-                <h3>£{vat_analysis['vat_threshold']:,.0f}</h3>
-                <p style="font-size: 0.8rem; color: #6b7280;">Registration threshold</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Net VAT Payable", f"£{vat_analysis['net_vat_payable']:,.0f}", help="Per rental day", border=True)
+            st.metric("VAT Threshold", f"£{vat_analysis['vat_threshold']:,.0f}", help="Registration threshold", border=True)
         
         with col3:
-            threshold_status = "✅ Must Register" if vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold'] else "⏳ Below Threshold"
-            threshold_color = "#dc2626" if vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold'] else "#059669"
-            st.markdown(f"""
-            <div class="metric-card" style="border-left-color: {threshold_color};">
-                <h4>Registration Status</h4>
-                <h3 style="color: {threshold_color};">{threshold_status}</h3>
-                <p style="font-size: 0.8rem; color: #6b7280;">
-                    {vat_analysis['months_to_threshold']:.0f} months to threshold
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.metric("Profit After VAT", f"£{vat_analysis['profit_after_vat']:,.0f}", help="Per rental day", border=True)
+            over_threshold = vat_analysis['annual_revenue'] >= vat_analysis['vat_threshold']
+            threshold_status = ("⏳ Below Threshold", "✅ Must Register")[over_threshold]
+            st.metric("Registration Status", threshold_status,
+                      help=f"{vat_analysis['months_to_threshold']:.0f} months to threshold", border=True)
 
         # VAT Breakdown Table
         st.markdown("**📊 VAT-Deductible Items Breakdown**")
         
-        vat_breakdown_data = []
-        for item, vat_amount in vat_analysis['vat_deductible_items'].items():
-            if vat_amount > 0:  # Only show items with VAT
-                vat_breakdown_data.append({
-                    'Item': item,
-                    'VAT Amount (£)': f"£{vat_amount:,.2f}",
-                    'VAT Rate': "20%",
-                    'Deductible': "✅ Yes"
-                })
-        
-        # Add additional costs VAT
-        if vat_analysis['additional_costs_vat'] > 0:
-            vat_breakdown_data.append({
-                'Item': 'Additional Costs',
-                'VAT Amount (£)': f"£{vat_analysis['additional_costs_vat']:,.2f}",
-                'VAT Rate': "20%",
-                'Deductible': "✅ Yes"
-            })
-        
-        vat_df = pd.DataFrame(vat_breakdown_data)
-        st.dataframe(vat_df, use_container_width=True)
+        vat_df = build_vat_breakdown(tuple(vat_analysis['vat_deductible_items'].items()), vat_analysis['additional_costs_vat'])
+        st.dataframe(vat_df, column_config={
+            'VAT Amount (£)': pence_column,
+            'VAT Rate': st.column_config.NumberColumn(format="%d%%"),
+            'Deductible': st.column_config.CheckboxColumn()
+        }, use_container_width=True)
         
         # VAT Impact Analysis
         st.markdown("**💡 VAT Impact Analysis**")
@@ -2106,87 +1997,41 @@ if mix_total == 100.0:
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("**VAT on Revenue:**")
-            st.markdown(f"- **Daily Revenue VAT:** £{vat_analysis['total_revenue_vat']:,.2f}")
-            st.markdown(f"- **Annual Revenue VAT:** £{vat_analysis['total_revenue_vat'] * 365:,.0f}")
-            st.markdown(f"- **VAT Rate Applied:** {vat_analysis['vat_rate'] * 100:.0f}%")
+            st.markdown("\n".join([
+                "**VAT on Revenue:**",
+                f"- **Daily Revenue VAT:** £{vat_analysis['total_revenue_vat']:,.2f}",
+                f"- **Annual Revenue VAT:** £{vat_analysis['total_revenue_vat'] * 365:,.0f}",
+                f"- **VAT Rate Applied:** {vat_analysis['vat_rate'] * 100:.0f}%"
+            ]))
         
         with col2:
-            st.markdown("**VAT on Costs:**")
-            st.markdown(f"- **Total VAT Deductible:** £{vat_analysis['total_vat_deductible']:,.2f}")
-            st.markdown(f"- **Net VAT Payable:** £{vat_analysis['net_vat_payable']:,.2f}")
-            st.markdown(f"- **VAT Recovery Rate:** {(vat_analysis['total_vat_deductible'] / vat_analysis['total_revenue_vat'] * 100):.1f}%")
+            # Guard against zero revenue VAT (e.g. zero drones) instead of raising ZeroDivisionError
+            revenue_vat = vat_analysis['total_revenue_vat']
+            recovery_rate = vat_analysis['total_vat_deductible'] / revenue_vat * 100.0 if revenue_vat else 0.0
+            st.markdown("\n".join([
+                "**VAT on Costs:**",
+                f"- **Total VAT Deductible:** £{vat_analysis['total_vat_deductible']:,.2f}",
+                f"- **Net VAT Payable:** £{vat_analysis['net_vat_payable']:,.2f}",
+                f"- **VAT Recovery Rate:** {recovery_rate:.1f}%"
+            ]))
 
         # VAT Planning Insights
-        st.markdown("""
-        <div style="background-color: #f8fafc; padding: 1rem; border-radius: 0.5rem; border-left: 4px solid #4f46e5;">
-            <h4>💡 VAT Planning Insights:</h4>
-            <ul>
-                <li><strong>VAT Registration Decision:</strong> If your annual revenue exceeds £85,000, you must register for VAT. This is a one-time decision.</li>
-                <li><strong>VAT-Deductible Costs:</strong> Ensure all business expenses are VAT-deductible to reduce your net VAT payable.</li>
-                <li><strong>VAT on Revenue:</strong> Always charge VAT on VATable revenue (e.g., drone rentals, website hosting).</li>
-                <li><strong>Quarterly VAT Payments:</strong> If you register for VAT, you must pay VAT quarterly to HMRC.</li>
-                <li><strong>VAT Refunds:</strong> If you register for VAT, you can claim back VAT on purchases and certain operational costs.</li>
-                <li><strong>VAT Recovery:</strong> Your current VAT recovery rate shows how much VAT you can claim back on business expenses.</li>
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_VAT_INSIGHTS, unsafe_allow_html=True)
 
         # VAT Charts
-        st.markdown("**📈 VAT Visualization**")
-        
-        chart_col1, chart_col2 = st.columns(2)
-        
-        with chart_col1:
-            # VAT Composition Chart
-            vat_composition = {
-                'VAT on Revenue': vat_analysis['total_revenue_vat'],
-                'VAT Deductible': vat_analysis['total_vat_deductible'],
-                'Net VAT Payable': vat_analysis['net_vat_payable']
-            }
-            
-            fig_vat = px.pie(
-                values=list(vat_composition.values()),
-                names=list(vat_composition.keys()),
-                title='VAT Composition',
-                color_discrete_sequence=['#4f46e5', '#059669', '#dc2626']
+        # Collapsed by default so the browser only renders the chart when asked for
+        with st.expander("📈 VAT Visualization", expanded=False):
+            # VAT Composition and VAT Impact on Profit share a single figure
+            fig_vat = build_vat_fig(
+                vat_analysis['total_revenue_vat'], vat_analysis['total_vat_deductible'], vat_analysis['net_vat_payable'],
+                vat_analysis['profit_before_vat'], vat_analysis['profit_after_vat']
             )
-            fig_vat.update_layout(height=400)
-            st.plotly_chart(fig_vat, use_container_width=True)
-        
-        with chart_col2:
-            # VAT Impact on Profit
-            profit_comparison = {
-                'Profit Before VAT': vat_analysis['profit_before_vat'],
-                'VAT Payable': vat_analysis['net_vat_payable'],
-                'Profit After VAT': vat_analysis['profit_after_vat']
-            }
-            
-            fig_profit = go.Figure()
-            fig_profit.add_trace(go.Bar(
-                x=list(profit_comparison.keys()),
-                y=list(profit_comparison.values()),
-                marker_color=['#4f46e5', '#dc2626', '#059669'],
-                text=[f"£{v:,.0f}" for v in profit_comparison.values()],
-                textposition='auto'
-            ))
             
-            fig_profit.update_layout(
-                title='VAT Impact on Daily Profit',
-                yaxis_title='Amount (£)',
-                height=400
-            )
-            
-            st.plotly_chart(fig_profit, use_container_width=True)
+            st.plotly_chart(fig_vat, use_container_width=True, key="vat_chart")
 
 else:
     st.warning("Please adjust the rental mix percentages to equal 100% to see calculations.")
 
 # Footer
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #6b7280; padding: 1rem;'>
-    <p>🚁 AeroRent UK Financial Calculator | Built with Streamlit</p>
-    <p>Last updated: """ + datetime.now().strftime("%B %d, %Y") + """</p>
-</div>
-""", unsafe_allow_html=True) 
+st.divider()
+st.html(_footer_html()) 